@@ -0,0 +1,30 @@
+"""Add login_otps table for OTPs shared across workers
+
+Revision ID: add_login_otps
+Revises: add_task_comment_index
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "add_login_otps"
+down_revision = "add_task_comment_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "login_otps",
+        sa.Column("email", sa.String(length=255), primary_key=True),
+        sa.Column("otp", sa.Integer(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("environment", sa.String(length=50), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("login_otps")
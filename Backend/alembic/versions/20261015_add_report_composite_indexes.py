@@ -0,0 +1,28 @@
+"""Add composite indexes for report queries
+
+Revision ID: add_report_composite_indexes
+Revises: add_work_summary_report
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "add_report_composite_indexes"
+down_revision = "add_work_summary_report"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # InnoDB secondary indexes carry the primary key, so these also cover the id columns
+    op.create_index("ix_attendance_user_checkin", "attendances", ["user_id", "check_in"])
+    op.create_index("ix_task_assigned_status", "tasks", ["assigned_to", "status"])
+    op.create_index("ix_leave_user_dates", "leaves", ["user_id", "start_date", "end_date", "status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_leave_user_dates", table_name="leaves")
+    op.drop_index("ix_task_assigned_status", table_name="tasks")
+    op.drop_index("ix_attendance_user_checkin", table_name="attendances")
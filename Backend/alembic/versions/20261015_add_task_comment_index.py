@@ -0,0 +1,24 @@
+"""Add task/created_at index for task comment threads
+
+Revision ID: add_task_comment_index
+Revises: add_task_status_index
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "add_task_comment_index"
+down_revision = "add_task_status_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Comments are always read per task in created_at order, so the index serves both the filter and the sort
+    op.create_index("ix_task_comments_task_created", "task_comments", ["task_id", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_comments_task_created", table_name="task_comments")
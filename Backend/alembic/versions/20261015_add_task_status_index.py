@@ -0,0 +1,24 @@
+"""Add status-leading task index for completed-task counts
+
+Revision ID: add_task_status_index
+Revises: add_report_composite_indexes
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "add_task_status_index"
+down_revision = "add_report_composite_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # MySQL has no partial indexes; leading with status lets COUNT(*) WHERE status = ... read only that range
+    op.create_index("ix_task_status_assigned", "tasks", ["status", "assigned_to"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_status_assigned", table_name="tasks")
@@ -0,0 +1,23 @@
+"""Add index on users.department for filtered employee listings
+
+Revision ID: add_user_department_index
+Revises: add_user_identifier_unique
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "add_user_department_index"
+down_revision = "add_user_identifier_unique"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_users_department", "users", ["department"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_department", table_name="users")
@@ -0,0 +1,30 @@
+"""Add unique indexes on users phone, PAN and Aadhar
+
+Revision ID: add_user_identifier_unique
+Revises: add_login_otps
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "add_user_identifier_unique"
+down_revision = "add_login_otps"
+branch_labels = None
+depends_on = None
+
+IDENTIFIER_COLUMNS = ("phone", "pan_card", "aadhar_card")
+
+
+def upgrade() -> None:
+    # Legacy rows store blanks as ''; turn them into NULL so they don't collide with each other
+    for column in IDENTIFIER_COLUMNS:
+        op.execute(sa.text(f"UPDATE users SET {column} = NULL WHERE TRIM({column}) = ''"))
+        op.create_unique_constraint(f"uq_users_{column}", "users", [column])
+
+
+def downgrade() -> None:
+    for column in reversed(IDENTIFIER_COLUMNS):
+        op.drop_constraint(f"uq_users_{column}", "users", type_="unique")
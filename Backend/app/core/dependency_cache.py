@@ -0,0 +1,49 @@
+import logging
+from functools import lru_cache
+import fastapi
+from fastapi.dependencies import utils as dependency_utils
+
+logger = logging.getLogger(__name__)
+
+# solve_dependencies asks on every request whether each dependency is a generator or
+# coroutine function; the answer never changes for a given callable, so memoize it.
+_INTROSPECTION_CHECKS = ("is_coroutine_callable", "is_gen_callable", "is_async_gen_callable")
+# The patch relies on fastapi.dependencies.utils looking these checks up by module-level
+# name at call time, which holds for this release (pinned in requirements.txt). Newer
+# releases may move them; re-verify with test_dependency_cache.py before bumping the pin.
+SUPPORTED_FASTAPI_VERSION = "0.118.2"
+
+
+def _memoize(check):
+    cached_check = lru_cache(maxsize=None)(check)
+
+    def wrapper(call):
+        try:
+            return cached_check(call)
+        except TypeError:
+            # Unhashable callables (rare) fall back to the uncached check
+            return check(call)
+
+    wrapper.__wrapped__ = check
+    wrapper.cache_info = cached_check.cache_info
+    return wrapper
+
+
+def install_dependency_cache() -> bool:
+    """Memoize FastAPI's dependency introspection checks; False when the patch was skipped"""
+    if fastapi.__version__ != SUPPORTED_FASTAPI_VERSION:
+        logger.warning(
+            "Dependency cache not installed: FastAPI %s is not the supported %s",
+            fastapi.__version__, SUPPORTED_FASTAPI_VERSION,
+        )
+        return False
+    missing = [name for name in _INTROSPECTION_CHECKS if not callable(getattr(dependency_utils, name, None))]
+    if missing:
+        logger.warning("Dependency cache not installed: fastapi.dependencies.utils has no %s", ", ".join(missing))
+        return False
+
+    for name in _INTROSPECTION_CHECKS:
+        check = getattr(dependency_utils, name)
+        if not hasattr(check, "__wrapped__"):
+            setattr(dependency_utils, name, _memoize(check))
+    return True
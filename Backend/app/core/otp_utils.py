@@ -1,11 +1,15 @@
 import random
 from datetime import datetime, timedelta
+from sqlalchemy import delete, func, select
 from app.core.config import settings
+from app.db.database import SessionLocal
+from app.db.models.login_otp import LoginOTP
 import logging
 
 logger = logging.getLogger(__name__)
 
-OTP_STORE = {}
+# OTPs live in the database rather than process memory so that send-otp and
+# verify-otp agree when they land on different uvicorn workers.
 
 def generate_otp(email: str) -> int:
     """Generate OTP based on environment settings"""
@@ -18,73 +22,84 @@ def generate_otp(email: str) -> int:
         otp = random.randint(100000, 999999)
         logger.info(f"Generated random OTP {otp} for email {email} in {settings.ENVIRONMENT} environment")
     
-    OTP_STORE[email] = {
-        "otp": otp, 
-        "expiry": datetime.utcnow() + timedelta(minutes=settings.OTP_EXPIRY_MINUTES),
-        "environment": settings.ENVIRONMENT
-    }
+    with SessionLocal() as db:
+        db.merge(LoginOTP(
+            email=email,
+            otp=otp,
+            expires_at=datetime.utcnow() + timedelta(minutes=settings.OTP_EXPIRY_MINUTES),
+            environment=settings.ENVIRONMENT
+        ))
+        db.commit()
     return otp
 
 def verify_otp(email: str, otp: int) -> bool:
     """Verify OTP with environment-aware logic"""
-    record = OTP_STORE.get(email)
-    
-    if not record:
-        logger.warning(f"No OTP record found for email {email}")
+    with SessionLocal() as db:
+        # Consume the OTP with a single conditional DELETE, so it can only be used once
+        # even when two verify requests race on different workers
+        consume = delete(LoginOTP).where(LoginOTP.email == email)
+        
+        # In testing/development, allow the testing OTP even if different from stored
+        accept_testing_otp = settings.should_use_fixed_otp and otp == int(settings.TESTING_OTP)
+        if not accept_testing_otp:
+            consume = consume.where(LoginOTP.otp == otp, LoginOTP.expires_at >= datetime.utcnow())
+        
+        consumed = db.execute(consume).rowcount
+        db.commit()
+        if consumed:
+            if accept_testing_otp:
+                logger.info(f"Accepted testing OTP {otp} for email {email} in {settings.ENVIRONMENT}")
+            else:
+                logger.info(f"OTP verified successfully for email {email} in {settings.ENVIRONMENT}")
+            return True
+        
+        # Nothing consumed: work out why for the log, dropping the OTP if it has expired
+        record = db.get(LoginOTP, email)
+        if not record:
+            logger.warning(f"No OTP record found for email {email}")
+        elif record.otp != otp:
+            logger.warning(f"Invalid OTP {otp} for email {email}. Expected {record.otp}")
+        else:
+            logger.warning(f"OTP expired for email {email}")
+            db.delete(record)
+            db.commit()
         return False
-    
-    # In testing/development, allow the testing OTP even if different from stored
-    if settings.should_use_fixed_otp and otp == int(settings.TESTING_OTP):
-        logger.info(f"Accepted testing OTP {otp} for email {email} in {settings.ENVIRONMENT}")
-        del OTP_STORE[email]
-        return True
-    
-    # Verify the actual stored OTP
-    if record["otp"] != otp:
-        logger.warning(f"Invalid OTP {otp} for email {email}. Expected {record['otp']}")
-        return False
-    
-    # Check expiry
-    if datetime.utcnow() > record["expiry"]:
-        logger.warning(f"OTP expired for email {email}")
-        del OTP_STORE[email]
-        return False
-    
-    logger.info(f"OTP verified successfully for email {email} in {settings.ENVIRONMENT}")
-    del OTP_STORE[email]
-    return True
 
 def get_otp_info(email: str) -> dict:
     """Get OTP information for debugging (only in non-production)"""
     if settings.is_production:
         return {"error": "OTP info not available in production"}
     
-    record = OTP_STORE.get(email)
+    with SessionLocal() as db:
+        record = db.get(LoginOTP, email)
     if not record:
         return {"error": "No OTP found"}
     
     return {
         "email": email,
-        "otp": record["otp"],
-        "expiry": record["expiry"].isoformat(),
-        "environment": record["environment"],
-        "is_expired": datetime.utcnow() > record["expiry"],
-        "time_remaining": max(0, (record["expiry"] - datetime.utcnow()).total_seconds())
+        "otp": record.otp,
+        "expiry": record.expires_at.isoformat(),
+        "environment": record.environment,
+        "is_expired": datetime.utcnow() > record.expires_at,
+        "time_remaining": max(0, (record.expires_at - datetime.utcnow()).total_seconds())
     }
 
 def clear_all_otps():
     """Clear all OTPs (useful for testing)"""
-    global OTP_STORE
-    OTP_STORE.clear()
+    with SessionLocal() as db:
+        db.execute(delete(LoginOTP))
+        db.commit()
     logger.info("All OTPs cleared")
 
 def get_environment_info() -> dict:
     """Get current environment information for debugging"""
+    with SessionLocal() as db:
+        active_otps = db.scalar(select(func.count()).select_from(LoginOTP))
     return {
         "environment": settings.ENVIRONMENT,
         "should_use_fixed_otp": settings.should_use_fixed_otp,
         "should_send_email": settings.should_send_email,
         "testing_otp": settings.TESTING_OTP if settings.should_use_fixed_otp else None,
         "enable_email_otp": settings.ENABLE_EMAIL_OTP,
-        "active_otps": len(OTP_STORE)
+        "active_otps": active_otps
     }
@@ -0,0 +1,45 @@
+import time
+from collections import deque
+from fastapi import HTTPException, Request
+
+# Sliding-window request log per (scope, client IP, email): timestamps of recent hits.
+# Kept in process memory so a rejected request never touches the database pool.
+RATE_LIMIT_HITS = {}
+# Drop idle keys once the log grows past this many entries
+RATE_LIMIT_SWEEP_AT = 10000
+
+
+def _sweep(now: float, window_seconds: int) -> None:
+    for key in [k for k, hits in RATE_LIMIT_HITS.items() if not hits or now - hits[-1] >= window_seconds]:
+        del RATE_LIMIT_HITS[key]
+
+
+def rate_limit(scope: str, limit: int, window_seconds: int):
+    """Dependency factory: allow at most `limit` calls per `window_seconds` per (IP, email)."""
+
+    # async so it runs on the event loop: no threadpool hop and no lock needed around the log
+    async def dependency(request: Request, email: str):
+        now = time.monotonic()
+        client_ip = request.client.host if request.client else "unknown"
+        key = (scope, client_ip, email.strip().lower())
+
+        hits = RATE_LIMIT_HITS.get(key)
+        if hits is None:
+            if len(RATE_LIMIT_HITS) >= RATE_LIMIT_SWEEP_AT:
+                _sweep(now, window_seconds)
+            hits = RATE_LIMIT_HITS[key] = deque()
+
+        while hits and now - hits[0] >= window_seconds:
+            hits.popleft()
+
+        if len(hits) >= limit:
+            retry_after = int(window_seconds - (now - hits[0])) + 1
+            raise HTTPException(
+                status_code=429,
+                detail="Too many requests. Please try again later.",
+                headers={"Retry-After": str(retry_after)},
+            )
+
+        hits.append(now)
+
+    return dependency
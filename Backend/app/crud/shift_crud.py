@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func, and_, or_, extract
 from datetime import datetime, date, timedelta, time as dt_time
 from typing import List, Optional
@@ -7,6 +7,10 @@ from app.db.models.user import User
 from app.db.models.leave import Leave
 from app.enums import RoleEnum
 
+# ShiftAssignmentOut serializes the nested user and shift; both are many-to-one, so a
+# JOIN in the same SELECT avoids one lazy load per assignment
+_ASSIGNMENT_RELATIONS = (joinedload(ShiftAssignment.user), joinedload(ShiftAssignment.shift))
+
 
 def create_shift(
     db: Session,
@@ -179,7 +183,7 @@ def get_user_shift_assignments(
     end_date: Optional[date] = None,
 ) -> List[ShiftAssignment]:
     """Get shift assignments for a user within a date range"""
-    query = db.query(ShiftAssignment).filter(ShiftAssignment.user_id == user_id)
+    query = db.query(ShiftAssignment).options(*_ASSIGNMENT_RELATIONS).filter(ShiftAssignment.user_id == user_id)
     
     if start_date:
         query = query.filter(ShiftAssignment.assignment_date >= start_date)
@@ -199,7 +203,7 @@ def get_department_shift_schedule(
     shifts = get_shifts_by_department(db, department)
     
     # Get all assignments for this date
-    assignments = db.query(ShiftAssignment).filter(
+    assignments = db.query(ShiftAssignment).options(*_ASSIGNMENT_RELATIONS).filter(
         ShiftAssignment.assignment_date == schedule_date
     ).all()
     
@@ -332,7 +336,10 @@ def create_shift_notification(
 
 def get_shift_notifications(db: Session, user_id: int) -> List[ShiftNotification]:
     """Get all shift notifications for a user"""
-    return db.query(ShiftNotification).filter(
+    return db.query(ShiftNotification).options(
+        joinedload(ShiftNotification.shift_assignment).joinedload(ShiftAssignment.user),
+        joinedload(ShiftNotification.shift_assignment).joinedload(ShiftAssignment.shift),
+    ).filter(
         ShiftNotification.user_id == user_id
     ).order_by(ShiftNotification.created_at.desc()).all()
 
@@ -88,7 +88,7 @@ def create_task(db: Session, title: str, description: str, assigned_by: int, ass
         assigned_by=assigned_by,
         assigned_to=assigned_to,
         due_date=due_date,
-        status=TaskStatus.PENDING,
+        status=TaskStatus.PENDING.value,
     )
     db.add(task)
     db.flush()
@@ -1,5 +1,7 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
+from sqlalchemy import or_, func, and_, select, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
 from app.db.models.user import User
 from app.enums import RoleEnum
 from passlib.context import CryptContext
@@ -12,6 +14,7 @@ from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.pdfgen import canvas
 from datetime import datetime
+from typing import Optional
 import io
 import csv
 import os
@@ -49,60 +52,145 @@ def hash_password(password: str) -> str:
     password_bytes = password.encode("utf-8")[:72]
     return pwd_context.hash(password_bytes)
 
+# Lookup statements are built once at import and only the bound value changes per call,
+# so each lookup reuses the same statement object and its cached compiled SQL
+_USER_BY_EMAIL = select(User).where(func.lower(User.email) == bindparam("email")).limit(1)
+_USER_BY_EMPLOYEE_ID = select(User).where(func.lower(User.employee_id) == bindparam("employee_id")).limit(1)
+_USER_BY_PHONE = select(User).where(User.phone == bindparam("phone")).limit(1)
+_USER_BY_PAN_CARD = select(User).where(User.pan_card == bindparam("pan_card")).limit(1)
+_USER_BY_AADHAR_CARD = select(User).where(User.aadhar_card == bindparam("aadhar_card")).limit(1)
+
 def get_user_by_email(db: Session, email: str):
     if not email:
         return None
     normalized_email = email.strip().lower()
-    return (
-        db.query(User)
-        .filter(func.lower(User.email) == normalized_email)
-        .first()
-    )
+    return db.scalars(_USER_BY_EMAIL, {"email": normalized_email}).first()
 
 def get_user_by_employee_id(db: Session, employee_id: str):
     if not employee_id:
         return None
     normalized_emp_id = employee_id.strip().lower()
-    return (
-        db.query(User)
-        .filter(func.lower(User.employee_id) == normalized_emp_id)
-        .first()
-    )
+    return db.scalars(_USER_BY_EMPLOYEE_ID, {"employee_id": normalized_emp_id}).first()
 
 def get_user_by_phone(db: Session, phone: str):
     if not phone:
         return None
     normalized_phone = phone.strip()
-    return (
-        db.query(User)
-        .filter(User.phone == normalized_phone)
-        .first()
-    )
+    return db.scalars(_USER_BY_PHONE, {"phone": normalized_phone}).first()
 
 def get_user_by_pan_card(db: Session, pan_card: str):
     if not pan_card:
         return None
     normalized_pan = pan_card.strip().upper()
-    return (
-        db.query(User)
-        .filter(User.pan_card == normalized_pan)
-        .first()
-    )
+    return db.scalars(_USER_BY_PAN_CARD, {"pan_card": normalized_pan}).first()
 
 def get_user_by_aadhar_card(db: Session, aadhar_card: str):
     if not aadhar_card:
         return None
     normalized_aadhar = aadhar_card.strip()
-    return (
-        db.query(User)
-        .filter(User.aadhar_card == normalized_aadhar)
-        .first()
-    )
+    return db.scalars(_USER_BY_AADHAR_CARD, {"aadhar_card": normalized_aadhar}).first()
+
+def _user_exists_stmt(condition, exclude_user_id: Optional[int] = None):
+    # EXISTS short-circuits on the first match and loads no User row
+    query = select(User.user_id).where(condition)
+    if exclude_user_id is not None:
+        query = query.where(User.user_id != exclude_user_id)
+    return select(query.exists())
+
+def _user_exists(db: Session, condition, exclude_user_id: Optional[int] = None) -> bool:
+    return db.scalar(_user_exists_stmt(condition, exclude_user_id))
+
+async def _user_exists_async(db: AsyncSession, condition, exclude_user_id: Optional[int] = None) -> bool:
+    return await db.scalar(_user_exists_stmt(condition, exclude_user_id))
+
+# Employee routes run on the event loop, so the helpers below take an AsyncSession
+
+async def email_exists(db: AsyncSession, email: str, exclude_user_id: Optional[int] = None) -> bool:
+    if not email:
+        return False
+    normalized_email = email.strip().lower()
+    return await _user_exists_async(db, func.lower(User.email) == normalized_email, exclude_user_id)
+
+async def employee_id_exists(db: AsyncSession, employee_id: str, exclude_user_id: Optional[int] = None) -> bool:
+    if not employee_id:
+        return False
+    normalized_emp_id = employee_id.strip().lower()
+    return await _user_exists_async(db, func.lower(User.employee_id) == normalized_emp_id, exclude_user_id)
+
+async def phone_exists(db: AsyncSession, phone: str, exclude_user_id: Optional[int] = None) -> bool:
+    if not phone:
+        return False
+    normalized_phone = phone.strip()
+    return await _user_exists_async(db, User.phone == normalized_phone, exclude_user_id)
+
+async def pan_card_exists(db: AsyncSession, pan_card: str, exclude_user_id: Optional[int] = None) -> bool:
+    if not pan_card:
+        return False
+    normalized_pan = pan_card.strip().upper()
+    return await _user_exists_async(db, User.pan_card == normalized_pan, exclude_user_id)
+
+async def aadhar_card_exists(db: AsyncSession, aadhar_card: str, exclude_user_id: Optional[int] = None) -> bool:
+    if not aadhar_card:
+        return False
+    normalized_aadhar = aadhar_card.strip()
+    return await _user_exists_async(db, User.aadhar_card == normalized_aadhar, exclude_user_id)
+
+# Unique index on users -> identifier it protects (index names come from the User model)
+USER_UNIQUE_INDEXES = {
+    "ix_users_email": "email",
+    "ix_users_employee_id": "employee_id",
+    "uq_users_phone": "phone",
+    "uq_users_pan_card": "pan_card",
+    "uq_users_aadhar_card": "aadhar_card",
+}
+
+def duplicate_user_field(error: IntegrityError) -> Optional[str]:
+    """Name the identifier whose unique index rejected an INSERT/UPDATE on users, if any"""
+    # MySQL reports "Duplicate entry ... for key 'users.<index>'", SQLite "UNIQUE constraint failed: users.<column>"
+    message = str(error.orig)
+    for index_name, field in USER_UNIQUE_INDEXES.items():
+        if index_name in message or f"users.{field}" in message:
+            return field
+    return None
+
+async def get_user_duplicates(
+    db: AsyncSession,
+    email: Optional[str] = None,
+    employee_id: Optional[str] = None,
+    phone: Optional[str] = None,
+    pan_card: Optional[str] = None,
+    aadhar_card: Optional[str] = None,
+    exclude_user_id: Optional[int] = None,
+) -> set:
+    """Return which of the given identifiers another user already has, using a single query"""
+    conditions = {}
+    if email and email.strip():
+        conditions["email"] = func.lower(User.email) == email.strip().lower()
+    if employee_id and employee_id.strip():
+        conditions["employee_id"] = func.lower(User.employee_id) == employee_id.strip().lower()
+    if phone and phone.strip():
+        conditions["phone"] = User.phone == phone.strip()
+    if pan_card and pan_card.strip():
+        conditions["pan_card"] = User.pan_card == pan_card.strip().upper()
+    if aadhar_card and aadhar_card.strip():
+        conditions["aadhar_card"] = User.aadhar_card == aadhar_card.strip()
+    if not conditions:
+        return set()
+
+    # Each match flag is evaluated by the database, so collation rules stay the same as the single-field checks
+    query = select(*(condition.label(field) for field, condition in conditions.items())).where(or_(*conditions.values()))
+    if exclude_user_id is not None:
+        query = query.where(User.user_id != exclude_user_id)
+    rows = (await db.execute(query)).all()
+    return {field for row in rows for field in conditions if row._mapping[field]}
 
-def get_user(db: Session, user_id: int):
-    return db.query(User).filter(User.user_id == user_id).first()
+def active_user_exists(db: Session, user_id: int) -> bool:
+    return _user_exists(db, and_(User.user_id == user_id, User.is_active == True))
 
-def create_user(db: Session, user: UserCreate):
+async def get_user(db: AsyncSession, user_id: int):
+    return await db.get(User, user_id)
+
+async def create_user(db: AsyncSession, user: UserCreate):
     db_user = User(
         user_id=None,
         employee_id=user.employee_id,
@@ -123,12 +211,40 @@ def create_user(db: Session, user: UserCreate):
         profile_photo=user.profile_photo
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    # Loads the server-generated created_at/joining_date
+    await db.refresh(db_user)
     return db_user
 
-def list_users(db: Session):
-    return db.query(User).all()
+async def list_users(
+    db: AsyncSession,
+    search: Optional[str] = None,
+    department: Optional[str] = None,
+    role: Optional[RoleEnum] = None,
+    after_id: Optional[int] = None,
+    limit: Optional[int] = None,
+):
+    # Ordered by primary key so after_id works as a keyset cursor (no OFFSET scan)
+    query = select(User).order_by(User.user_id)
+    if after_id is not None:
+        query = query.where(User.user_id > after_id)
+    if limit is not None:
+        query = query.limit(limit)
+    if search:
+        # Case-insensitive substring match; autoescape keeps % and _ in the search literal
+        term = search.lower()
+        query = query.where(
+            or_(
+                func.lower(User.name).contains(term, autoescape=True),
+                func.lower(User.email).contains(term, autoescape=True),
+                func.lower(User.department).contains(term, autoescape=True),
+            )
+        )
+    if department:
+        query = query.where(User.department == department)
+    if role:
+        query = query.where(User.role == role)
+    return (await db.scalars(query)).all()
 
 def get_employees(db: Session, search: str = None, department: str = None, role: RoleEnum = None):
     query = db.query(User)
@@ -146,31 +262,34 @@ def get_employees(db: Session, search: str = None, department: str = None, role:
         query = query.filter(User.role == role)
     return query.all()
 
-def update_user_role(db: Session, user_id: int, role: RoleEnum):
-    user = db.query(User).filter(User.user_id == user_id).first()
-    if user:
-        user.role = role
-        db.commit()
-        db.refresh(user)
-    return user
+# Role and status go through an ORM flush (not a Core UPDATE) so the User mapper
+# events clear the cached report department lists
+async def update_user_role(db: AsyncSession, user_id: int, role: RoleEnum) -> bool:
+    """Set a user's role; False when the user does not exist"""
+    user = await db.get(User, user_id)
+    if not user:
+        return False
+    user.role = role
+    await db.commit()
+    return True
 
-def update_user_status(db: Session, user_id: int, is_active: bool):
-    """Update user active/inactive status"""
-    user = db.query(User).filter(User.user_id == user_id).first()
-    if user:
-        user.is_active = is_active
-        db.commit()
-        db.refresh(user)
-    return user
+async def update_user_status(db: AsyncSession, user_id: int, is_active: bool) -> bool:
+    """Update user active/inactive status; False when the user does not exist"""
+    user = await db.get(User, user_id)
+    if not user:
+        return False
+    user.is_active = is_active
+    await db.commit()
+    return True
 
-def delete_user(db: Session, user_id: int):
-    user = db.query(User).filter(User.user_id == user_id).first()
+async def delete_user(db: AsyncSession, user_id: int):
+    user = await db.get(User, user_id)
     if user:
-        db.delete(user)
-        db.commit()
+        await db.delete(user)
+        await db.commit()
     return user
 
-def export_users_pdf(db: Session):
+def export_users_pdf(users: list):
     """Generate a modern, professional PDF with company branding and hierarchical organization"""
     buffer = io.BytesIO()
     
@@ -301,8 +420,6 @@ def export_users_pdf(db: Session):
         alignment=TA_CENTER
     )
     
-    # Fetch all users
-    users = db.query(User).all()
     elements.append(Paragraph(
         f"Total Employees: {len(users)} | Report Generated: {datetime.now().strftime('%B %d, %Y')}",
         meta_style
@@ -400,33 +517,47 @@ def export_users_pdf(db: Session):
     buffer.seek(0)
     return buffer
 
-def export_users_csv(db: Session):
+CSV_HEADER = ["Employee ID", "Name", "Email", "Role", "Department", "Designation", "Phone", "Address", "PAN Card", "Aadhaar Card", "Shift Type", "Joining Date", "Status"]
+
+def _user_csv_row(user: User) -> list:
+    return [
+        user.employee_id,
+        user.name,
+        user.email,
+        user.role.value,
+        user.department or "",
+        user.designation or "",
+        user.phone or "",
+        user.address or "",
+        user.pan_card or "",
+        user.aadhar_card or "",
+        user.shift_type or "",
+        user.joining_date.strftime("%Y-%m-%d") if user.joining_date else "",
+        "Active" if user.is_active else "Inactive"
+    ]
+
+async def iter_user_batches(db: AsyncSession, batch_size: int = 500):
+    """Yield users in user_id order, batch_size at a time, through a server-side cursor"""
+    # Only one batch of User objects is alive at a time, so memory stays O(batch_size)
+    result = await db.stream(select(User).order_by(User.user_id).execution_options(yield_per=batch_size))
+    async for users in result.scalars().partitions():
+        yield users
+
+async def iter_users_csv(db: AsyncSession):
+    """Yield the users CSV one batch of rows at a time"""
     output = io.StringIO()
     writer = csv.writer(output)
 
-    # Fetch all users
-    users = db.query(User).all()
-
     # CSV Header
-    writer.writerow(["Employee ID", "Name", "Email", "Role", "Department", "Designation", "Phone", "Address", "PAN Card", "Aadhaar Card", "Shift Type", "Joining Date", "Status"])
+    writer.writerow(CSV_HEADER)
 
     # CSV Data
-    for user in users:
-        writer.writerow([
-            user.employee_id,
-            user.name,
-            user.email,
-            user.role.value,
-            user.department or "",
-            user.designation or "",
-            user.phone or "",
-            user.address or "",
-            user.pan_card or "",
-            user.aadhar_card or "",
-            user.shift_type or "",
-            user.joining_date.strftime("%Y-%m-%d") if user.joining_date else "",
-            "Active" if user.is_active else "Inactive"
-        ])
-
-    output.seek(0)
-    return output
+    async for users in iter_user_batches(db):
+        for user in users:
+            writer.writerow(_user_csv_row(user))
+        yield output.getvalue()
+        output.seek(0)
+        output.truncate(0)
+
+    if output.tell():
+        yield output.getvalue()
@@ -8,6 +8,7 @@ from .notification import LeaveNotification, TaskNotification
 from .hiring import Vacancy, Candidate
 from .shift import Shift, ShiftAssignment, ShiftNotification
 from .online_status import OnlineStatus
+from .login_otp import LoginOTP
 
 # Base import
 from app.db.database import Base
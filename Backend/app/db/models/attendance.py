@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, String, Float, func, Text
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, String, Float, func, Text, Index
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 from datetime import datetime
 
 class Attendance(Base):
     __tablename__ = "attendances"
+    __table_args__ = (
+        Index("ix_attendance_user_checkin", "user_id", "check_in"),
+    )
 
     attendance_id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"))
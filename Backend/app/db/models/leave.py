@@ -1,9 +1,12 @@
-from sqlalchemy import Column, Integer, DateTime, String, ForeignKey, func
+from sqlalchemy import Column, Integer, DateTime, String, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 
 class Leave(Base):
     __tablename__ = "leaves"
+    __table_args__ = (
+        Index("ix_leave_user_dates", "user_id", "start_date", "end_date", "status"),
+    )
     leave_id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"))
     start_date = Column(DateTime, nullable=False)
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, DateTime, String
+from app.db.database import Base
+
+class LoginOTP(Base):
+    """Pending login OTPs, shared by every worker process."""
+
+    __tablename__ = "login_otps"
+
+    email = Column(String(255), primary_key=True)
+    otp = Column(Integer, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    environment = Column(String(50), nullable=True)
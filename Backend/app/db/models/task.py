@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 
 from app.enums import TaskStatus
@@ -8,12 +8,16 @@ from app.db.database import Base
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_task_assigned_status", "assigned_to", "status"),
+        Index("ix_task_status_assigned", "status", "assigned_to"),
+    )
     task_id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
     description = Column(String(1024))
     assigned_by = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"))
     assigned_to = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"))
-    status = Column(String(50), default=TaskStatus.PENDING)
+    status = Column(String(50), default=TaskStatus.PENDING.value)
     due_date = Column(DateTime)
     last_passed_by = Column(Integer, ForeignKey("users.user_id", ondelete="SET NULL"), nullable=True)
     last_passed_to = Column(Integer, ForeignKey("users.user_id", ondelete="SET NULL"), nullable=True)
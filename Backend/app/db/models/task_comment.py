@@ -1,11 +1,14 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 
 
 class TaskComment(Base):
     __tablename__ = "task_comments"
+    __table_args__ = (
+        Index("ix_task_comments_task_created", "task_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     task_id = Column(Integer, ForeignKey("tasks.task_id", ondelete="CASCADE"), nullable=False)
@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, String, Enum, Text, DateTime, Boolean, func
+from sqlalchemy import Column, Integer, String, Enum, Text, DateTime, Boolean, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 from app.enums import RoleEnum
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        UniqueConstraint("phone", name="uq_users_phone"),
+        UniqueConstraint("pan_card", name="uq_users_pan_card"),
+        UniqueConstraint("aadhar_card", name="uq_users_aadhar_card"),
+    )
 
     # Primary Key
     user_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
@@ -17,7 +22,7 @@ class User(Base):
     role = Column(Enum(RoleEnum), default=RoleEnum.EMPLOYEE)
 
     # Optional Info
-    department = Column(String(255), nullable=True)
+    department = Column(String(255), nullable=True, index=True)
     designation = Column(String(255), nullable=True)
     gender = Column(String(50), nullable=True)
     phone = Column(String(20), nullable=True)
@@ -1,7 +1,10 @@
+import hashlib
+from datetime import datetime, timedelta
 from fastapi import Depends, HTTPException, status
 from fastapi.security import APIKeyHeader
 from jose import jwt, JWTError
 from app.db.database import get_db
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import Session
 from app.db.models.user import User
 from app.core.config import settings
@@ -9,19 +12,51 @@ from app.enums import RoleEnum
 
 api_key_header = APIKeyHeader(name="Authorization")
 
+# Verified tokens mapped to their decoded claims, so repeat requests skip the JWT
+# signature check. Claims never change for a given token, so entries need no
+# invalidation. The user row is still loaded on every request, so role and
+# is_active changes apply on the next request in every worker.
+TOKEN_CLAIMS_CACHE_TTL = timedelta(minutes=10)
+TOKEN_CLAIMS_CACHE = {}
+
+
+def _cache_token_claims(token_key: str, payload: dict) -> None:
+    now = datetime.utcnow()
+    for key in [k for k, v in TOKEN_CLAIMS_CACHE.items() if v["expiry"] <= now]:
+        del TOKEN_CLAIMS_CACHE[key]
+
+    expiry = now + TOKEN_CLAIMS_CACHE_TTL
+    if payload.get("exp"):
+        expiry = min(expiry, datetime.utcfromtimestamp(payload["exp"]))
+    TOKEN_CLAIMS_CACHE[token_key] = {"payload": payload, "expiry": expiry}
+
+
+def _get_cached_claims(token_key: str):
+    cached = TOKEN_CLAIMS_CACHE.get(token_key)
+    if not cached or datetime.utcnow() >= cached["expiry"]:
+        return None
+    return cached["payload"]
+
+
 def get_current_user(token: str = Depends(api_key_header), db: Session = Depends(get_db)) -> User:
     if token.startswith("Bearer "):
         token = token.split(" ")[1]
 
-    try:
-        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
-    except JWTError:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
+    token_key = hashlib.sha256(token.encode()).hexdigest()
+    payload = _get_cached_claims(token_key)
+    if payload is None:
+        try:
+            payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+        except JWTError:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
+        _cache_token_claims(token_key, payload)
+
+    email: str = payload.get("sub")
+    if email is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
 
-    user = db.query(User).filter(User.email == email).first()
+    # lambda_stmt caches the built statement; only the email is re-bound per call
+    user = db.scalars(lambda_stmt(lambda: select(User).where(User.email == email))).first()
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     
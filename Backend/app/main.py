@@ -1,12 +1,14 @@
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from sqlalchemy import text
 from app.db import models
 from app.db.database import engine
+from app.core.dependency_cache import install_dependency_cache
+from app.services.email_service import SMTPConnection
 from app.routes import (
     user_routes,
     attendance_routes,
@@ -56,9 +58,12 @@ except Exception as _e:
     pass
 
 # Initialize FastAPI
+install_dependency_cache()
+# orjson encodes the (already jsonable) route payloads much faster than json.dumps
 app = FastAPI(
     title="Employee Management System",
-    version="1.0"
+    version="1.0",
+    default_response_class=ORJSONResponse
 )
 
 # Note: If you get 413 Payload Too Large errors, configure your web server:
@@ -124,7 +129,8 @@ app.include_router(report_routes.router)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     response = JSONResponse(
         status_code=exc.status_code,
-        content={"detail": exc.detail}
+        content={"detail": exc.detail},
+        headers=exc.headers
     )
     # Add CORS headers to error responses
     response.headers["Access-Control-Allow-Origin"] = "*"
@@ -159,6 +165,16 @@ async def general_exception_handler(request: Request, exc: Exception):
     response.headers["Access-Control-Allow-Credentials"] = "true"
     return response
 
+@app.on_event("startup")
+def create_shared_clients():
+    # One SMTP session per worker, opened on first send and reused afterwards
+    app.state.smtp_client = SMTPConnection()
+
+@app.on_event("shutdown")
+def shutdown_worker_pools():
+    report_routes.shutdown_pdf_pool()
+    app.state.smtp_client.close()
+
 @app.get("/")
 async def home():
     return {"message": "Employee Management System API is running"}
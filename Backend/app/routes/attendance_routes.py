@@ -4,17 +4,19 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, case, or_
 from datetime import datetime, timedelta, time, date
 from zoneinfo import ZoneInfo
+from time import time_ns
 from app.db.database import get_db
 from app.db.models.attendance import Attendance
 from app.db.models.user import User
 from app.db.models.office_timing import OfficeTiming
 from app.schemas.attendance_schema import AttendanceOut, LocationData
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import StreamingResponse, JSONResponse, Response
 from app.dependencies import get_current_user
+from app.crud.user_crud import active_user_exists
 from app.enums import RoleEnum
 from typing import Optional, List, Dict, Any, Union, Tuple
 from decimal import Decimal
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 import base64
 import os
 import shutil
@@ -27,6 +29,9 @@ from app.schemas.office_timing_schema import OfficeTimingOut, OfficeTimingCreate
 
 router = APIRouter(prefix="/attendance", tags=["Attendance"])
 
+# Serializes already-built AttendanceOut records straight to JSON bytes (no re-validation)
+ATTENDANCE_LIST_ADAPTER = TypeAdapter(List[AttendanceOut])
+
 
 class AttendanceJSONPayload(BaseModel):
     user_id: int
@@ -633,7 +638,7 @@ def save_selfie(user_id: int, selfie: UploadFile, prefix: str = 'checkin') -> Op
     os.makedirs(UPLOAD_DIR, exist_ok=True)
     
     file_extension = selfie.filename.split('.')[-1] if '.' in selfie.filename else 'jpg'
-    file_name = f"{user_id}_{prefix}_{datetime.now().strftime('%Y%m%d%H%M%S')}.{file_extension}"
+    file_name = f"{user_id}_{prefix}_{time_ns()}.{file_extension}"
     file_path = os.path.join(UPLOAD_DIR, file_name)
     
     with open(file_path, "wb") as buffer:
@@ -650,7 +655,7 @@ def save_work_report_file(user_id: int, document: UploadFile) -> Optional[str]:
     os.makedirs(UPLOAD_DIR, exist_ok=True)
 
     ext = document.filename.split('.')[-1] if document.filename and '.' in document.filename else 'bin'
-    file_name = f"{user_id}_work_report_{datetime.now().strftime('%Y%m%d%H%M%S')}.{ext}"
+    file_name = f"{user_id}_work_report_{time_ns()}.{ext}"
     file_path = os.path.join(UPLOAD_DIR, file_name)
 
     with open(file_path, "wb") as buffer:
@@ -681,7 +686,7 @@ def save_base64_work_report(user_id: int, data: str) -> Optional[str]:
 
     upload_dir = "static/work_reports"
     os.makedirs(upload_dir, exist_ok=True)
-    file_name = f"{user_id}_work_report_{datetime.now().strftime('%Y%m%d%H%M%S')}.{ext}"
+    file_name = f"{user_id}_work_report_{time_ns()}.{ext}"
     file_path = os.path.join(upload_dir, file_name)
     with open(file_path, "wb") as f:
         f.write(raw)
@@ -791,8 +796,7 @@ async def employee_check_in_route(
             )
 
         # Validate user exists and is active
-        user = db.query(User).filter(User.user_id == user_id, User.is_active == True).first()
-        if not user:
+        if not active_user_exists(db, user_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found or inactive"
@@ -867,8 +871,7 @@ async def employee_check_in_json(
     db: Session = Depends(get_db)
 ):
     try:
-        user = db.query(User).filter(User.user_id == payload.user_id, User.is_active == True).first()
-        if not user:
+        if not active_user_exists(db, payload.user_id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found or inactive")
 
         selfie_path = None
@@ -881,7 +884,7 @@ async def employee_check_in_json(
             raw = base64.b64decode(b64data)
             UPLOAD_DIR = "static/selfies"
             os.makedirs(UPLOAD_DIR, exist_ok=True)
-            file_name = f"{payload.user_id}_checkin_{datetime.now().strftime('%Y%m%d%H%M%S')}.jpg"
+            file_name = f"{payload.user_id}_checkin_{time_ns()}.jpg"
             file_path = os.path.join(UPLOAD_DIR, file_name)
             with open(file_path, 'wb') as f:
                 f.write(raw)
@@ -954,8 +957,7 @@ async def employee_check_out_route(
 ):
     try:
         # Validate user exists and is active
-        user = db.query(User).filter(User.user_id == user_id, User.is_active == True).first()
-        if not user:
+        if not active_user_exists(db, user_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found or inactive"
@@ -1049,8 +1051,7 @@ async def employee_check_out_json(
     db: Session = Depends(get_db)
 ):
     try:
-        user = db.query(User).filter(User.user_id == payload.user_id, User.is_active == True).first()
-        if not user:
+        if not active_user_exists(db, payload.user_id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found or inactive")
 
         selfie_path = None
@@ -1070,7 +1071,7 @@ async def employee_check_out_json(
 
             UPLOAD_DIR = "static/selfies"
             os.makedirs(UPLOAD_DIR, exist_ok=True)
-            file_name = f"{payload.user_id}_checkout_{datetime.now().strftime('%Y%m%d%H%M%S')}.jpg"
+            file_name = f"{payload.user_id}_checkout_{time_ns()}.jpg"
             file_path = os.path.join(UPLOAD_DIR, file_name)
             with open(file_path, 'wb') as f:
                 f.write(raw)
@@ -1140,7 +1141,7 @@ async def employee_check_out_json(
         raise HTTPException(status_code=500, detail=f"Error in JSON check-out: {str(e)}")
 
 # Employee Self-Attendance (Last 6 Months)
-@router.get("/my-attendance/{user_id}", response_model=list[AttendanceOut])
+@router.get("/my-attendance/{user_id}", response_model=None, responses={200: {"model": List[AttendanceOut]}})
 def get_self_attendance(user_id: int, db: Session = Depends(get_db)):
     six_months_ago = datetime.utcnow() - timedelta(days=180)
     records = (
@@ -1150,7 +1151,8 @@ def get_self_attendance(user_id: int, db: Session = Depends(get_db)):
         .all()
     )
 
-    return [_prepare_attendance_payload(record) for record in records]
+    history = [AttendanceOut.from_orm_fast(_prepare_attendance_payload(record)) for record in records]
+    return Response(content=ATTENDANCE_LIST_ADAPTER.dump_json(history), media_type="application/json")
 
 # Today's Attendance Summary
 @router.get("/summary")
@@ -1,20 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from datetime import timedelta
 from app.db.database import get_db
 from app.db.models.user import User
 from app.core.otp_utils import generate_otp, verify_otp, get_environment_info, get_otp_info
-from app.services.email_service import send_otp_email, test_email_configuration
+from app.services.email_service import SMTPConnection, send_otp_email, test_email_configuration
 from app.core.security import create_token
 from app.core.config import settings
+from app.core.rate_limit import rate_limit
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+def get_smtp_client(request: Request) -> SMTPConnection:
+    return request.app.state.smtp_client
+
 @router.post("/send-otp")
-def send_otp(email: str, db: Session = Depends(get_db)):
+def send_otp(
+    email: str,
+    background_tasks: BackgroundTasks,
+    _: None = Depends(rate_limit("send-otp", 5, 300)),
+    db: Session = Depends(get_db),
+    smtp_client: SMTPConnection = Depends(get_smtp_client),
+):
     """Send OTP with environment-aware logic"""
     user = db.query(User).filter(User.email == email).first()
     if not user:
@@ -33,8 +43,8 @@ def send_otp(email: str, db: Session = Depends(get_db)):
     # Get environment info for logging
     env_info = get_environment_info()
     
-    # Send OTP using environment-aware email service
-    email_sent = send_otp_email(email, otp, env_info)
+    # Send OTP using environment-aware email service once the response is out, so SMTP latency isn't on the request
+    background_tasks.add_task(send_otp_email, email, otp, env_info, smtp_client)
     
     response_message = "OTP sent successfully"
     if not settings.should_send_email:
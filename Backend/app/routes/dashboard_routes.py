@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, case, distinct
 from datetime import datetime, timedelta
 
 from app.db.database import get_db
@@ -12,6 +12,11 @@ from app.dependencies import get_current_user
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
+# Task status values as stored in the tasks.status column
+_COMPLETED = TaskStatus.COMPLETED.value
+_IN_PROGRESS = TaskStatus.IN_PROGRESS.value
+_OPEN_STATUSES = (TaskStatus.PENDING.value, _IN_PROGRESS)
+
 
 def _today_bounds():
     today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
@@ -86,12 +91,12 @@ def admin_dashboard(db: Session = Depends(get_db)):
     )
     active_tasks = (
         db.query(func.count(Task.task_id))
-        .filter(Task.status.in_([TaskStatus.PENDING.value, TaskStatus.IN_PROGRESS.value]))
+        .filter(Task.status.in_(_OPEN_STATUSES))
         .scalar() or 0
     )
     completed_tasks = (
         db.query(func.count(Task.task_id))
-        .filter(Task.status == TaskStatus.COMPLETED.value)
+        .filter(Task.status == _COMPLETED)
         .scalar() or 0
     )
     # Department performance (by presence rate today)
@@ -370,13 +375,13 @@ def manager_dashboard(current_user=Depends(get_current_user), db: Session = Depe
     active_tasks = (
         db.query(func.count(Task.task_id))
         .join(User, User.user_id == Task.assigned_to)
-        .filter(User.department == dept, Task.status.in_([TaskStatus.PENDING.value, TaskStatus.IN_PROGRESS.value]))
+        .filter(User.department == dept, Task.status.in_(_OPEN_STATUSES))
         .scalar() or 0
     )
     completed_tasks = (
         db.query(func.count(Task.task_id))
         .join(User, User.user_id == Task.assigned_to)
-        .filter(User.department == dept, Task.status == TaskStatus.COMPLETED.value)
+        .filter(User.department == dept, Task.status == _COMPLETED)
         .scalar() or 0
     )
     pending_approvals = (
@@ -396,7 +401,7 @@ def manager_dashboard(current_user=Depends(get_current_user), db: Session = Depe
         .join(User, User.user_id == Task.assigned_to)
         .filter(
             User.department == dept,
-            Task.status != TaskStatus.COMPLETED.value,
+            Task.status != _COMPLETED,
             Task.due_date.isnot(None),
             Task.due_date < datetime.utcnow()
         )
@@ -511,22 +516,36 @@ def manager_dashboard(current_user=Depends(get_current_user), db: Session = Depe
     activities.sort(key=lambda item: item["time"], reverse=True)
     team_activities = activities[:15]
 
-    team_leads = db.query(User).filter(User.department == dept, User.role == RoleEnum.TEAM_LEAD).all()
-    team_performance = []
-    for lead in team_leads:
-        lead_tasks = (
-            db.query(Task)
-            .filter(Task.assigned_by == lead.user_id)
+    team_leads = (
+        db.query(User.user_id, User.name, User.designation)
+        .filter(User.department == dept, User.role == RoleEnum.TEAM_LEAD)
+        .all()
+    )
+    # Task counts per lead are aggregated in SQL instead of loading every task row
+    lead_stats = {
+        row.assigned_by: row
+        for row in (
+            db.query(
+                Task.assigned_by,
+                func.count(Task.task_id).label("total"),
+                func.sum(case((Task.status == _COMPLETED, 1), else_=0)).label("completed"),
+                func.count(distinct(Task.assigned_to)).label("members"),
+            )
+            .filter(Task.assigned_by.in_([lead.user_id for lead in team_leads]))
+            .group_by(Task.assigned_by)
             .all()
         )
-        total_lead_tasks = len(lead_tasks)
-        completed_lead_tasks = len([t for t in lead_tasks if t.status == TaskStatus.COMPLETED.value])
+    } if team_leads else {}
+    team_performance = []
+    for lead in team_leads:
+        stats = lead_stats.get(lead.user_id)
+        total_lead_tasks = stats.total if stats else 0
+        completed_lead_tasks = int(stats.completed or 0) if stats else 0
         completion_rate = int((completed_lead_tasks / max(total_lead_tasks, 1)) * 100)
-        member_ids = {task.assigned_to for task in lead_tasks if task.assigned_to}
         team_performance.append({
             "team": lead.designation or f"{lead.name}'s Team",
             "lead": lead.name,
-            "members": len(member_ids),
+            "members": stats.members if stats else 0,
             "completion": completion_rate,
         })
 
@@ -576,13 +595,13 @@ def team_lead_dashboard(current_user=Depends(get_current_user), db: Session = De
     tasks_in_progress = (
         db.query(func.count(Task.task_id))
         .join(User, User.user_id == Task.assigned_to)
-        .filter(User.department == dept, Task.status == TaskStatus.IN_PROGRESS.value)
+        .filter(User.department == dept, Task.status == _IN_PROGRESS)
         .scalar() or 0
     )
     completed_today = (
         db.query(func.count(Task.task_id))
         .join(User, User.user_id == Task.assigned_to)
-        .filter(User.department == dept, Task.status == TaskStatus.COMPLETED.value)
+        .filter(User.department == dept, Task.status == _COMPLETED)
         .scalar() or 0
     )
     pending_reviews = 0  # Not modeled
@@ -668,8 +687,8 @@ def employee_dashboard(current_user=Depends(get_current_user), db: Session = Dep
     today_start, today_end = _today_bounds()
 
     tasks_assigned = db.query(func.count(Task.task_id)).filter(Task.assigned_to == user_id).scalar() or 0
-    tasks_completed = db.query(func.count(Task.task_id)).filter(Task.assigned_to == user_id, Task.status == TaskStatus.COMPLETED.value).scalar() or 0
-    tasks_pending = db.query(func.count(Task.task_id)).filter(Task.assigned_to == user_id, Task.status.in_([TaskStatus.PENDING.value, TaskStatus.IN_PROGRESS.value])).scalar() or 0
+    tasks_completed = db.query(func.count(Task.task_id)).filter(Task.assigned_to == user_id, Task.status == _COMPLETED).scalar() or 0
+    tasks_pending = db.query(func.count(Task.task_id)).filter(Task.assigned_to == user_id, Task.status.in_(_OPEN_STATUSES)).scalar() or 0
 
     # Leaves available not modeled; return 0 and expose leavesTaken from approved leaves this year
     leaves_taken = db.query(func.count(Leave.leave_id)).filter(Leave.user_id == user_id, Leave.status == "Approved").scalar() or 0
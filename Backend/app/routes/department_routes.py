@@ -129,7 +129,7 @@ def sync_departments_from_users(
             # Ensure code is unique
             base_code = code
             counter = 1
-            while db.query(Department).filter(Department.code == code).first():
+            while db.query(db.query(Department.id).filter(Department.code == code).exists()).scalar():
                 code = f"{base_code}{counter}"
                 counter += 1
             
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from typing import List, Optional
@@ -9,6 +9,7 @@ from app.enums import RoleEnum
 from app.db.models.hiring import Vacancy, Candidate
 from app.db.models.user import User
 from datetime import datetime
+from pydantic import TypeAdapter
 import json
 import os
 
@@ -17,6 +18,11 @@ router = APIRouter(
     tags=["Hiring Management"]
 )
 
+# The list routes validate each row into VacancyOut/CandidateOut themselves, so the results are
+# written straight to JSON instead of response_model dumping and re-validating every item
+VACANCY_LIST_ADAPTER = TypeAdapter(List[VacancyOut])
+CANDIDATE_LIST_ADAPTER = TypeAdapter(List[CandidateOut])
+
 # Vacancy Routes
 
 @router.post("/vacancies", response_model=VacancyOut, status_code=status.HTTP_201_CREATED)
@@ -56,7 +62,7 @@ def create_vacancy(
     result.candidates_count = candidates_count
     return result
 
-@router.get("/vacancies", response_model=List[VacancyOut])
+@router.get("/vacancies", response_model=None, responses={200: {"model": List[VacancyOut]}})
 def get_vacancies(
     department: Optional[str] = None,
     status_filter: Optional[str] = None,
@@ -87,7 +93,7 @@ def get_vacancies(
         vacancy_out.candidates_count = candidates_count
         result.append(vacancy_out)
     
-    return result
+    return Response(content=VACANCY_LIST_ADAPTER.dump_json(result), media_type="application/json")
 
 @router.get("/vacancies/{vacancy_id}", response_model=VacancyOut)
 def get_vacancy(
@@ -266,7 +272,7 @@ def create_candidate(
     result.vacancy_department = vacancy.department
     return result
 
-@router.get("/candidates", response_model=List[CandidateOut])
+@router.get("/candidates", response_model=None, responses={200: {"model": List[CandidateOut]}})
 def get_candidates(
     vacancy_id: Optional[int] = None,
     status_filter: Optional[str] = None,
@@ -304,7 +310,7 @@ def get_candidates(
             candidate_out.vacancy_department = vacancy.department
         result.append(candidate_out)
     
-    return result
+    return Response(content=CANDIDATE_LIST_ADAPTER.dump_json(result), media_type="application/json")
 
 @router.get("/candidates/{candidate_id}", response_model=CandidateOut)
 def get_candidate(
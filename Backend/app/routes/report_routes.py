@@ -2,22 +2,34 @@
 Report Routes - Employee Performance and Department Metrics
 """
 from fastapi import APIRouter, Depends, Query, HTTPException, status as http_status
-from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from fastapi.responses import Response, FileResponse
+from starlette.background import BackgroundTask
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, extract, select, case, and_, event, literal
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Optional, List, Tuple
+from collections import defaultdict
+from dataclasses import dataclass, asdict
+from functools import lru_cache
 import traceback
 import io
+import os
+import tempfile
+import uuid
 import csv
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.platypus import Table, TableStyle, Paragraph, Spacer
+from reportlab.pdfgen import canvas
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from pypdf import PdfWriter
 
-from app.db.database import get_db
+from app.db.database import get_async_db, AsyncSessionLocal
 from app.db.models.user import User
 from app.db.models.attendance import Attendance
 from app.db.models.task import Task
@@ -27,14 +39,267 @@ from app.enums import RoleEnum, TaskStatus
 
 router = APIRouter(prefix="/reports", tags=["Reports"])
 
+# Task status values as stored in the tasks.status column
+_COMPLETED = TaskStatus.COMPLETED.value
+_PENDING = TaskStatus.PENDING.value
+_IN_PROGRESS = TaskStatus.IN_PROGRESS.value
+_OPEN_STATUSES = (_PENDING, _IN_PROGRESS)
+
+# Check-in after / check-out before these times counts as late arrival / early departure
+_LATE_AFTER = '09:30:00'
+_EARLY_BEFORE = '18:00:00'
+
+# Active department names are shared by sibling report endpoints hit in one page load.
+# Departments change rarely and user writes clear the cache, so the TTL is only a safety net.
+DEPARTMENTS_CACHE_TTL = timedelta(minutes=5)
+DEPARTMENTS_CACHE = {}
+
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _clear_departments_cache(mapper, connection, target):
+    """Drop the cached department list when any user row is written"""
+    DEPARTMENTS_CACHE.clear()
+
+
+# Monthly report responses keyed by (endpoint, year, month, filters).
+# Past months are not immutable: task counts span all time and attendance/leaves can be
+# edited after the fact, so every month gets the same short TTL. Writes through the ORM
+# clear the cache sooner; the TTL bounds Core UPDATEs and writes on other workers.
+REPORT_CACHE_TTL = timedelta(seconds=60)
+REPORT_CACHE = {}
+
+
+def _clear_report_cache(mapper, connection, target):
+    """Drop cached reports when any row they read from is written"""
+    REPORT_CACHE.clear()
+
+
+for _model in (User, Attendance, Task, Leave):
+    for _event in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event, _clear_report_cache)
+
+
+# Background report jobs: job_id -> {"status", "result", "error", "expiry"}
+REPORT_JOB_TTL = timedelta(hours=1)
+REPORT_JOBS = {}
+# Strong references so running job tasks are not garbage collected
+_report_job_tasks = set()
+
+
+def get_cached_report(key: tuple) -> Optional[dict]:
+    """Return a cached report response if it has not expired"""
+    cached = REPORT_CACHE.get(key)
+    if cached and datetime.utcnow() < cached["expiry"]:
+        return cached["data"]
+    return None
+
+
+def cache_report(key: tuple, data: dict, ttl: timedelta) -> dict:
+    """Store a report response, dropping expired entries first"""
+    now = datetime.utcnow()
+    for stale_key in [k for k, v in REPORT_CACHE.items() if v["expiry"] <= now]:
+        del REPORT_CACHE[stale_key]
+    REPORT_CACHE[key] = {"data": data, "expiry": now + ttl}
+    return data
+
+@dataclass(slots=True, kw_only=True)
+class EmployeePerformance:
+    """One row of the employee performance report (field names are the JSON keys)"""
+    id: str
+    employeeId: str
+    name: str
+    department: str
+    role: str
+    attendanceScore: int
+    taskCompletionRate: int
+    # Manual ratings are set via frontend; overall rating needs them, so they start at 0
+    productivity: int = 0
+    qualityScore: int = 0
+    overallRating: int = 0
+    month: str
+    year: int
+    totalTasks: int
+    completedTasks: int
+    attendanceDays: int
+    workingDays: int
+
+
+# Process pool for CPU-bound PDF builds so they don't block the event loop
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+PDF_WORKERS = min(4, os.cpu_count() or 1)
+
+# Employees per PDF shard; larger reports are rendered in parallel and merged
+PDF_SHARD_SIZE = 50
+
+
+def get_pdf_pool() -> ProcessPoolExecutor:
+    """Return the shared PDF process pool, creating it on first use"""
+    global _pdf_pool
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _pdf_pool
+
+
+def _month_range(month: int, year: int) -> Tuple[datetime, datetime]:
+    """
+    Return [start, end) datetimes for a report month.
+    Frontend sends 0-indexed month (0-11); end is the first day of the next month.
+    """
+    try:
+        start_date = datetime(year, month + 1, 1)
+        end_date = datetime(year + month // 11, (month + 1) % 12 + 1, 1)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid date: month={month}, year={year}. Error: {str(e)}"
+        )
+    return start_date, end_date
+
+
+@lru_cache(maxsize=256)
+def _working_days(start: datetime, end: datetime) -> int:
+    """Count Monday-Friday days in [start, end) without iterating day by day"""
+    days = (end.date() - start.date()).days
+    if days <= 0:
+        return 0
+    full_weeks, remainder = divmod(days, 7)
+    first_weekday = start.weekday()
+    last_weekday = first_weekday + remainder
+    # Leftover days run from first_weekday up to (not including) last_weekday and may wrap past Sunday
+    return full_weeks * 5 + max(0, min(last_weekday, 5) - first_weekday) + max(0, last_weekday - 7)
+
+
+async def _get_active_departments(db: AsyncSession) -> List[str]:
+    """Sorted distinct departments with active employees, cached until a user changes"""
+    cached = DEPARTMENTS_CACHE.get("departments")
+    if cached and datetime.utcnow() < cached["expiry"]:
+        return cached["departments"]
+    
+    rows = (await db.execute(
+        select(User.department).where(
+            User.is_active == True,
+            User.department.isnot(None),
+            User.department != ''
+        ).distinct().order_by(User.department)
+    )).all()
+    departments = [dept for (dept,) in rows if dept]
+    
+    DEPARTMENTS_CACHE["departments"] = {
+        "departments": departments,
+        "expiry": datetime.utcnow() + DEPARTMENTS_CACHE_TTL,
+    }
+    return departments
+
+
+def shutdown_pdf_pool():
+    """Stop the PDF worker processes (called on app shutdown)"""
+    global _pdf_pool
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(wait=False, cancel_futures=True)
+        _pdf_pool = None
+
+
+async def _compute_employee_performance(
+    db: AsyncSession,
+    start_date: datetime,
+    end_date: datetime,
+    year: int,
+    department: Optional[str],
+    employee_id: Optional[str],
+) -> dict:
+    """Build the employee performance report for [start_date, end_date)"""
+    
+    # Count working days in the month (excluding weekends)
+    total_working_days = _working_days(start_date, end_date)
+    
+    # Per-employee attendance and task counts, pre-aggregated and joined to the employees
+    attendance_stats = (
+        select(Attendance.user_id.label("user_id"), func.count().label("days"))
+        .where(Attendance.check_in >= start_date, Attendance.check_in < end_date)
+        .group_by(Attendance.user_id)
+        .subquery()
+    )
+    task_stats = (
+        select(
+            Task.assigned_to.label("user_id"),
+            func.count().label("total"),
+            func.sum(case((Task.status == _COMPLETED, 1), else_=0)).label("completed")
+        )
+        .group_by(Task.assigned_to)
+        .subquery()
+    )
+    attendance_days = func.coalesce(attendance_stats.c.days, 0)
+    total_tasks = func.coalesce(task_stats.c.total, 0)
+    completed_tasks = func.coalesce(task_stats.c.completed, 0)
+    
+    # Scores are rounded (half up) and capped by the database, so rows come back ready to copy
+    if total_working_days > 0:
+        attendance_score = func.round(attendance_days * 100.0 / total_working_days)
+        attendance_score = case((attendance_score > 100, 100), else_=attendance_score)
+    else:
+        attendance_score = literal(0)
+    task_completion_rate = case((total_tasks > 0, func.round(completed_tasks * 100.0 / total_tasks)), else_=0)
+    
+    query = (
+        select(
+            User.user_id,
+            User.employee_id,
+            User.name,
+            User.department,
+            User.role,
+            attendance_days.label("attendance_days"),
+            total_tasks.label("total_tasks"),
+            completed_tasks.label("completed_tasks"),
+            attendance_score.label("attendance_score"),
+            task_completion_rate.label("task_completion_rate")
+        )
+        .outerjoin(attendance_stats, attendance_stats.c.user_id == User.user_id)
+        .outerjoin(task_stats, task_stats.c.user_id == User.user_id)
+        .where(User.is_active == True)
+    )
+    
+    # Apply filters
+    if department and department != 'all':
+        query = query.where(User.department == department)
+    
+    if employee_id:
+        query = query.where(User.employee_id == employee_id)
+    
+    rows = (await db.execute(query.order_by(User.name))).all()
+    
+    month_name = start_date.strftime("%B")
+    results = [
+        EmployeePerformance(
+            id=str(row.user_id),
+            employeeId=row.employee_id or str(row.user_id),
+            name=row.name,
+            department=row.department or "N/A",
+            role=row.role.value if hasattr(row.role, 'value') else str(row.role),
+            attendanceScore=int(row.attendance_score),
+            taskCompletionRate=int(row.task_completion_rate),
+            month=month_name,
+            year=year,
+            totalTasks=int(row.total_tasks),
+            completedTasks=int(row.completed_tasks),
+            attendanceDays=int(row.attendance_days),
+            workingDays=total_working_days
+        )
+        for row in rows
+    ]
+    
+    return {"employees": [asdict(r) for r in results]}
+
 
 @router.get("/employee-performance")
-def get_employee_performance(
+async def get_employee_performance(
+    response: Response,
     month: int = Query(..., ge=0, le=11, description="Month (0-11)"),
     year: int = Query(..., description="Year"),
     department: Optional[str] = Query(None, description="Filter by department"),
     employee_id: Optional[str] = Query(None, description="Filter by employee ID"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -42,122 +307,100 @@ def get_employee_performance(
     Calculates attendance score and task completion rate from actual data.
     """
     
+    start_date, end_date = _month_range(month, year)
+    
+    cache_key = ("employee-performance", year, month, department, employee_id)
+    response.headers["Cache-Control"] = f"private, max-age={int(REPORT_CACHE_TTL.total_seconds())}"
+    cached = get_cached_report(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        # Calculate date range for the month
-        # Frontend sends 0-indexed month (0-11), convert to 1-indexed (1-12)
-        actual_month = month + 1
-        
-        start_date = datetime(year, actual_month, 1)
-        # Calculate end date (first day of next month)
-        if actual_month == 12:
-            end_date = datetime(year + 1, 1, 1)
-        else:
-            end_date = datetime(year, actual_month + 1, 1)
-    except ValueError as e:
-        # Handle invalid date
-        raise HTTPException(
-            status_code=http_status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid date: month={month}, year={year}. Error: {str(e)}"
-        )
+        data = await _compute_employee_performance(db, start_date, end_date, year, department, employee_id)
+        return cache_report(cache_key, data, REPORT_CACHE_TTL)
     except Exception as e:
-        # Catch any other errors
-        print(f"Error in employee-performance: {str(e)}")
+        print(f"Error processing employees: {str(e)}")
         print(traceback.format_exc())
         raise HTTPException(
             status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error calculating employee performance: {str(e)}"
+            detail=f"Error processing employee data: {str(e)}"
         )
+
+
+@router.post("/employee-performance/jobs", status_code=http_status.HTTP_202_ACCEPTED)
+async def start_employee_performance_job(
+    month: int = Query(..., ge=0, le=11, description="Month (0-11)"),
+    year: int = Query(..., description="Year"),
+    department: Optional[str] = Query(None, description="Filter by department"),
+    employee_id: Optional[str] = Query(None, description="Filter by employee ID"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Start building the employee performance report in the background.
+    Poll GET /reports/jobs/{job_id} for the result; large organisations can take
+    longer than an HTTP request timeout to compute.
+    """
+    start_date, end_date = _month_range(month, year)
+    
+    now = datetime.utcnow()
+    for stale_id in [k for k, v in REPORT_JOBS.items() if v["expiry"] <= now]:
+        del REPORT_JOBS[stale_id]
     
+    job_id = uuid.uuid4().hex
+    REPORT_JOBS[job_id] = {"status": "pending", "result": None, "error": None, "expiry": now + REPORT_JOB_TTL}
+    
+    cache_key = ("employee-performance", year, month, department, employee_id)
+    task = asyncio.create_task(
+        _run_employee_performance_job(job_id, cache_key, start_date, end_date, year, department, employee_id)
+    )
+    _report_job_tasks.add(task)
+    task.add_done_callback(_report_job_tasks.discard)
+    
+    return {"job_id": job_id, "status": "pending"}
+
+
+@router.get("/jobs/{job_id}")
+async def get_report_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+):
+    """Get the status of a background report job, with its result once done"""
+    job = REPORT_JOBS.get(job_id)
+    if not job or datetime.utcnow() >= job["expiry"]:
+        raise HTTPException(status_code=http_status.HTTP_404_NOT_FOUND, detail="Report job not found")
+    
+    return {"job_id": job_id, "status": job["status"], "result": job["result"], "error": job["error"]}
+
+
+async def _run_employee_performance_job(
+    job_id: str,
+    cache_key: tuple,
+    start_date: datetime,
+    end_date: datetime,
+    year: int,
+    department: Optional[str],
+    employee_id: Optional[str],
+):
+    """Compute the report with its own session (the request's is closed by now) and store it on the job"""
     try:
-        # Base query for active employees
-        query = db.query(User).filter(User.is_active == True)
-        
-        # Apply filters
-        if department and department != 'all':
-            query = query.filter(User.department == department)
-        
-        if employee_id:
-            query = query.filter(User.employee_id == employee_id)
-        
-        employees = query.order_by(User.name).all()
-        
-        results = []
-        for emp in employees:
-            # Calculate attendance score
-            # Count working days in the month (excluding weekends)
-            total_working_days = 0
-            current = start_date
-            while current < end_date:
-                if current.weekday() < 5:  # Monday = 0, Friday = 4
-                    total_working_days += 1
-                current += timedelta(days=1)
-            
-            # Count actual attendance days
-            attendance_records = db.query(Attendance).filter(
-                Attendance.user_id == emp.user_id,
-                Attendance.check_in >= start_date,
-                Attendance.check_in < end_date
-            ).count()
-            
-            attendance_score = round((attendance_records / total_working_days) * 100) if total_working_days > 0 else 0
-            attendance_score = min(attendance_score, 100)  # Cap at 100%
-            
-            # Calculate task completion rate
-            total_tasks = db.query(Task).filter(
-                Task.assigned_to == emp.user_id
-            ).count()
-            
-            completed_tasks = db.query(Task).filter(
-                Task.assigned_to == emp.user_id,
-                Task.status == str(TaskStatus.COMPLETED)
-            ).count()
-            
-            task_completion_rate = round((completed_tasks / total_tasks) * 100) if total_tasks > 0 else 0
-            
-            # Manual ratings default to 0 (will be set via frontend)
-            productivity = 0
-            quality_score = 0
-            
-            # Calculate overall rating (only if manual ratings are provided)
-            if productivity > 0 and quality_score > 0:
-                overall_rating = round((attendance_score + task_completion_rate + productivity + quality_score) / 4)
-            else:
-                overall_rating = 0
-            
-            results.append({
-                "id": str(emp.user_id),
-                "employeeId": emp.employee_id or str(emp.user_id),
-                "name": emp.name,
-                "department": emp.department or "N/A",
-                "role": emp.role.value if hasattr(emp.role, 'value') else str(emp.role),
-                "attendanceScore": attendance_score,
-                "taskCompletionRate": task_completion_rate,
-                "productivity": productivity,
-                "qualityScore": quality_score,
-                "overallRating": overall_rating,
-                "month": start_date.strftime("%B"),
-                "year": year,
-                "totalTasks": total_tasks,
-                "completedTasks": completed_tasks,
-                "attendanceDays": attendance_records,
-                "workingDays": total_working_days
-            })
-        
-        return {"employees": results}
+        data = get_cached_report(cache_key)
+        if data is None:
+            async with AsyncSessionLocal() as db:
+                data = await _compute_employee_performance(db, start_date, end_date, year, department, employee_id)
+            cache_report(cache_key, data, REPORT_CACHE_TTL)
+        REPORT_JOBS[job_id].update(status="done", result=data)
     except Exception as e:
-        print(f"Error processing employees: {str(e)}")
+        print(f"Error in employee-performance job {job_id}: {str(e)}")
         print(traceback.format_exc())
-        raise HTTPException(
-            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error processing employee data: {str(e)}"
-        )
+        REPORT_JOBS[job_id].update(status="failed", error=f"Error processing employee data: {str(e)}")
 
 
 @router.get("/department-metrics")
-def get_department_metrics(
+async def get_department_metrics(
+    response: Response,
     month: int = Query(..., ge=0, le=11, description="Month (0-11)"),
     year: int = Query(..., description="Year"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -165,86 +408,63 @@ def get_department_metrics(
     Aggregates employee data by department.
     """
     
-    try:
-        # Calculate date range
-        # Frontend sends 0-indexed month (0-11), convert to 1-indexed (1-12)
-        actual_month = month + 1
-        
-        start_date = datetime(year, actual_month, 1)
-        # Calculate end date (first day of next month)
-        if actual_month == 12:
-            end_date = datetime(year + 1, 1, 1)
-        else:
-            end_date = datetime(year, actual_month + 1, 1)
-    except ValueError as e:
-        raise HTTPException(
-            status_code=http_status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid date: month={month}, year={year}. Error: {str(e)}"
-        )
-    except Exception as e:
-        print(f"Error in department-metrics date calculation: {str(e)}")
-        print(traceback.format_exc())
-        raise HTTPException(
-            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error calculating date range: {str(e)}"
-        )
+    start_date, end_date = _month_range(month, year)
+    
+    cache_key = ("department-metrics", year, month)
+    response.headers["Cache-Control"] = f"private, max-age={int(REPORT_CACHE_TTL.total_seconds())}"
+    cached = get_cached_report(cache_key)
+    if cached is not None:
+        return cached
     
     # Calculate working days
-    total_working_days = 0
-    current = start_date
-    while current < end_date:
-        if current.weekday() < 5:
-            total_working_days += 1
-        current += timedelta(days=1)
-    
-    # Get all departments with active employees
-    departments = db.query(User.department).filter(
+    total_working_days = _working_days(start_date, end_date)
+    
+    active_in_department = and_(
         User.is_active == True,
         User.department.isnot(None),
         User.department != ''
-    ).distinct().all()
+    )
+    
+    # Attendance days per active employee, with the employee's department
+    attendance_rows = (await db.execute(
+        select(User.department, func.count(Attendance.attendance_id).label("days"))
+        .outerjoin(Attendance, and_(
+            Attendance.user_id == User.user_id,
+            Attendance.check_in >= start_date,
+            Attendance.check_in < end_date
+        ))
+        .where(active_in_department)
+        .group_by(User.user_id, User.department)
+    )).all()
+    
+    # Completed and pending task counts per department
+    task_rows = (await db.execute(
+        select(
+            User.department,
+            func.sum(case((Task.status == _COMPLETED, 1), else_=0)).label("completed"),
+            func.sum(case((Task.status.in_(_OPEN_STATUSES), 1), else_=0)).label("pending")
+        )
+        .join(Task, Task.assigned_to == User.user_id)
+        .where(active_in_department)
+        .group_by(User.department)
+    )).all()
+    task_counts = {row.department: row for row in task_rows}
+    
+    # Attendance score is capped per employee before averaging
+    attendance_scores = defaultdict(list)
+    for row in attendance_rows:
+        emp_attendance_score = (row.days / total_working_days) * 100 if total_working_days > 0 else 0
+        attendance_scores[row.department].append(min(emp_attendance_score, 100))
     
     results = []
-    for (dept_name,) in departments:
-        if not dept_name:
-            continue
-        
-        # Get employees in department
-        dept_employees = db.query(User).filter(
-            User.department == dept_name,
-            User.is_active == True
-        ).all()
-        
-        total_employees = len(dept_employees)
-        
-        if total_employees == 0:
-            continue
+    for dept_name in sorted(attendance_scores):
+        scores = attendance_scores[dept_name]
+        total_employees = len(scores)
+        avg_attendance = round(sum(scores) / total_employees)
         
-        # Calculate average attendance
-        total_attendance_score = 0
-        for emp in dept_employees:
-            attendance_count = db.query(Attendance).filter(
-                Attendance.user_id == emp.user_id,
-                Attendance.check_in >= start_date,
-                Attendance.check_in < end_date
-            ).count()
-            emp_attendance_score = (attendance_count / total_working_days) * 100 if total_working_days > 0 else 0
-            total_attendance_score += min(emp_attendance_score, 100)
-        
-        avg_attendance = round(total_attendance_score / total_employees) if total_employees > 0 else 0
-        
-        # Calculate tasks for department
-        dept_user_ids = [emp.user_id for emp in dept_employees]
-        
-        tasks_completed = db.query(Task).filter(
-            Task.assigned_to.in_(dept_user_ids),
-            Task.status == str(TaskStatus.COMPLETED)
-        ).count()
-        
-        tasks_pending = db.query(Task).filter(
-            Task.assigned_to.in_(dept_user_ids),
-            Task.status.in_([str(TaskStatus.PENDING), str(TaskStatus.IN_PROGRESS)])
-        ).count()
+        task_row = task_counts.get(dept_name)
+        tasks_completed = int(task_row.completed or 0) if task_row else 0
+        tasks_pending = int(task_row.pending or 0) if task_row else 0
         
         # Calculate task completion rate
         total_tasks = tasks_completed + tasks_pending
@@ -266,85 +486,94 @@ def get_department_metrics(
     # Sort by performance score descending
     results.sort(key=lambda x: x['performanceScore'], reverse=True)
     
-    return {"departments": results}
+    return cache_report(cache_key, {"departments": results}, REPORT_CACHE_TTL)
 
 
 @router.get("/executive-summary")
-def get_executive_summary(
+async def get_executive_summary(
+    response: Response,
     month: int = Query(..., ge=0, le=11, description="Month (0-11)"),
     year: int = Query(..., description="Year"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Get executive summary with top performers and key metrics.
     """
     
-    # Calculate date range
-    # Frontend sends 0-indexed month (0-11), convert to 1-indexed (1-12)
-    actual_month = month + 1
+    start_date, end_date = _month_range(month, year)
     
-    try:
-        start_date = datetime(year, actual_month, 1)
-        # Calculate end date (first day of next month)
-        if actual_month == 12:
-            end_date = datetime(year + 1, 1, 1)
-        else:
-            end_date = datetime(year, actual_month + 1, 1)
-    except ValueError as e:
-        from fastapi import HTTPException, status as http_status
-        raise HTTPException(
-            status_code=http_status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid date: month={month}, year={year}. Error: {str(e)}"
-        )
-    
-    # Get all active employees
-    employees = db.query(User).filter(User.is_active == True).all()
+    cache_key = ("executive-summary", year, month)
+    response.headers["Cache-Control"] = f"private, max-age={int(REPORT_CACHE_TTL.total_seconds())}"
+    cached = get_cached_report(cache_key)
+    if cached is not None:
+        return cached
     
     # Calculate working days
-    total_working_days = 0
-    current = start_date
-    while current < end_date:
-        if current.weekday() < 5:
-            total_working_days += 1
-        current += timedelta(days=1)
+    total_working_days = _working_days(start_date, end_date)
+    
+    # Attendance and task counts for every active employee in one query
+    attendance_stats = (
+        select(Attendance.user_id.label("user_id"), func.count().label("attendance_days"))
+        .where(Attendance.check_in >= start_date, Attendance.check_in < end_date)
+        .group_by(Attendance.user_id)
+        .subquery()
+    )
+    task_stats = (
+        select(
+            Task.assigned_to.label("user_id"),
+            func.count().label("total_tasks"),
+            func.sum(case((Task.status == _COMPLETED, 1), else_=0)).label("completed_tasks")
+        )
+        .group_by(Task.assigned_to)
+        .subquery()
+    )
+    employees = (await db.execute(
+        select(
+            User.name,
+            User.department,
+            attendance_stats.c.attendance_days,
+            task_stats.c.total_tasks,
+            task_stats.c.completed_tasks
+        )
+        .outerjoin(attendance_stats, attendance_stats.c.user_id == User.user_id)
+        .outerjoin(task_stats, task_stats.c.user_id == User.user_id)
+        .where(User.is_active == True)
+        .order_by(User.user_id)
+    )).all()
     
     # Calculate metrics for each employee
     employee_scores = []
     total_performance = 0
+    # Running [score sum, employee count] per department for the best-department pick
+    dept_totals = defaultdict(lambda: [0, 0])
     
     for emp in employees:
         # Attendance score
-        attendance_count = db.query(Attendance).filter(
-            Attendance.user_id == emp.user_id,
-            Attendance.check_in >= start_date,
-            Attendance.check_in < end_date
-        ).count()
+        attendance_count = int(emp.attendance_days or 0)
         attendance_score = (attendance_count / total_working_days) * 100 if total_working_days > 0 else 0
         attendance_score = min(attendance_score, 100)
         
         # Task completion
-        total_tasks = db.query(Task).filter(
-            Task.assigned_to == emp.user_id
-        ).count()
-        
-        completed_tasks = db.query(Task).filter(
-            Task.assigned_to == emp.user_id,
-            Task.status == str(TaskStatus.COMPLETED)
-        ).count()
-        
+        total_tasks = int(emp.total_tasks or 0)
+        completed_tasks = int(emp.completed_tasks or 0)
         task_score = (completed_tasks / total_tasks) * 100 if total_tasks > 0 else 0
         
         # Overall score (average of attendance and tasks)
         overall_score = (attendance_score + task_score) / 2
         
+        score = round(overall_score)
         employee_scores.append({
             "name": emp.name,
-            "score": round(overall_score),
+            "score": score,
             "department": emp.department
         })
         
         total_performance += overall_score
+        
+        if emp.department and emp.department != 'N/A':
+            dept_totals[emp.department][0] += score
+            dept_totals[emp.department][1] += 1
     
     # Find top performer
     top_performer = max(employee_scores, key=lambda x: x['score']) if employee_scores else {"name": "N/A", "score": 0}
@@ -353,26 +582,20 @@ def get_executive_summary(
     avg_performance = round(total_performance / len(employees)) if employees else 0
     
     # Total tasks completed
-    total_tasks_completed = db.query(Task).filter(
-        Task.status == str(TaskStatus.COMPLETED)
-    ).count()
+    total_tasks_completed = await db.scalar(
+        select(func.count()).select_from(Task).where(
+            Task.status == _COMPLETED
+        )
+    )
     
     # Find best department
-    dept_scores = {}
-    for emp_score in employee_scores:
-        dept = emp_score['department']
-        if dept and dept != 'N/A':
-            if dept not in dept_scores:
-                dept_scores[dept] = []
-            dept_scores[dept].append(emp_score['score'])
-    
     best_dept = {"name": "N/A", "score": 0}
-    for dept, scores in dept_scores.items():
-        avg_score = sum(scores) / len(scores)
+    for dept, (score_sum, count) in dept_totals.items():
+        avg_score = score_sum / count
         if avg_score > best_dept['score']:
             best_dept = {"name": dept, "score": round(avg_score)}
     
-    return {
+    return cache_report(cache_key, {
         "topPerformer": top_performer,
         "avgPerformance": avg_performance,
         "totalTasksCompleted": total_tasks_completed,
@@ -395,22 +618,16 @@ def get_executive_summary(
             "Conduct training needs assessment",
             "Implement weekly progress tracking"
         ]
-    }
+    }, REPORT_CACHE_TTL)
 
 
 @router.get("/departments")
-def get_departments_list(
-    db: Session = Depends(get_db),
+async def get_departments_list(
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get list of all departments with active employees"""
-    departments = db.query(User.department).filter(
-        User.is_active == True,
-        User.department.isnot(None),
-        User.department != ''
-    ).distinct().order_by(User.department).all()
-    
-    return {"departments": [dept[0] for dept in departments if dept[0]]}
+    return {"departments": await _get_active_departments(db)}
 
 
 
@@ -420,7 +637,7 @@ async def export_performance_report(
     start_date: str = Query(..., description="Start date (YYYY-MM-DD)"),
     end_date: str = Query(..., description="End date (YYYY-MM-DD)"),
     employee_id: Optional[str] = Query(None, description="Specific employee ID (optional)"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -433,64 +650,95 @@ async def export_performance_report(
         start = datetime.strptime(start_date, '%Y-%m-%d')
         end = datetime.strptime(end_date, '%Y-%m-%d')
         
-        # Get employees
-        query = db.query(User).filter(User.is_active == True)
+        # Per-employee attendance and task aggregates, joined to the employees in one round trip
+        attendance_stats = (
+            select(
+                Attendance.user_id.label("user_id"),
+                func.count().label("attendance_days"),
+                func.sum(case((func.time(Attendance.check_in) > _LATE_AFTER, 1), else_=0)).label("late_arrivals"),
+                func.sum(case(
+                    (and_(Attendance.check_out.isnot(None), func.time(Attendance.check_out) < _EARLY_BEFORE), 1),
+                    else_=0,
+                )).label("early_departures"),
+            )
+            .where(Attendance.check_in >= start, Attendance.check_in <= end)
+            .group_by(Attendance.user_id)
+            .cte("attendance_stats")
+        )
+        task_stats = (
+            select(
+                Task.assigned_to.label("user_id"),
+                func.count().label("total_tasks"),
+                func.sum(case((Task.status == _COMPLETED, 1), else_=0)).label("completed_tasks"),
+                func.sum(case((Task.status == _PENDING, 1), else_=0)).label("pending_tasks"),
+                func.sum(case((Task.status == _IN_PROGRESS, 1), else_=0)).label("in_progress_tasks"),
+            )
+            .group_by(Task.assigned_to)
+            .cte("task_stats")
+        )
+        
+        query = (
+            select(
+                User,
+                attendance_stats.c.attendance_days,
+                attendance_stats.c.late_arrivals,
+                attendance_stats.c.early_departures,
+                task_stats.c.total_tasks,
+                task_stats.c.completed_tasks,
+                task_stats.c.pending_tasks,
+                task_stats.c.in_progress_tasks,
+            )
+            .outerjoin(attendance_stats, attendance_stats.c.user_id == User.user_id)
+            .outerjoin(task_stats, task_stats.c.user_id == User.user_id)
+            .where(User.is_active == True)
+        )
         if employee_id:
-            query = query.filter(User.employee_id == employee_id)
-        employees = query.all()
+            query = query.where(User.employee_id == employee_id)
+        rows = (await db.execute(query.order_by(User.user_id))).all()
         
-        if not employees:
+        if not rows:
             raise HTTPException(
                 status_code=http_status.HTTP_404_NOT_FOUND,
                 detail="No employees found"
             )
         
+        # Leaves in range for these employees (day counts and type breakdown are summed below)
+        leaves_by_user = defaultdict(list)
+        leave_rows = (await db.execute(
+            select(Leave.user_id, Leave.status, Leave.leave_type, Leave.start_date, Leave.end_date).where(
+                Leave.user_id.in_([row.User.user_id for row in rows]),
+                Leave.start_date >= start,
+                Leave.end_date <= end
+            )
+        )).all()
+        for leave in leave_rows:
+            leaves_by_user[leave.user_id].append(leave)
+        
+        # Working days in range (end date inclusive) are the same for every employee
+        total_working_days = _working_days(start, end + timedelta(days=1))
+        
         # Collect comprehensive data for each employee
         report_data = []
         
-        for emp in employees:
-            # Calculate working days in range
-            total_working_days = 0
-            current = start
-            while current <= end:
-                if current.weekday() < 5:  # Monday-Friday
-                    total_working_days += 1
-                current += timedelta(days=1)
+        for row in rows:
+            emp = row.User
             
             # Attendance data
-            attendance_records = db.query(Attendance).filter(
-                Attendance.user_id == emp.user_id,
-                Attendance.check_in >= start,
-                Attendance.check_in <= end
-            ).all()
-            
-            attendance_days = len(attendance_records)
+            attendance_days = int(row.attendance_days or 0)
             attendance_score = round((attendance_days / total_working_days) * 100) if total_working_days > 0 else 0
-            
-            # Calculate late arrivals
-            late_count = sum(1 for att in attendance_records if att.check_in.time() > datetime.strptime('09:30', '%H:%M').time())
-            
-            # Calculate early departures
-            early_departure_count = sum(1 for att in attendance_records if att.check_out and att.check_out.time() < datetime.strptime('18:00', '%H:%M').time())
+            late_count = int(row.late_arrivals or 0)
+            early_departure_count = int(row.early_departures or 0)
             
             # Task data
-            tasks = db.query(Task).filter(
-                Task.assigned_to == emp.user_id
-            ).all()
-            
-            total_tasks = len(tasks)
-            completed_tasks = sum(1 for t in tasks if t.status == str(TaskStatus.COMPLETED))
-            pending_tasks = sum(1 for t in tasks if t.status == str(TaskStatus.PENDING))
-            in_progress_tasks = sum(1 for t in tasks if t.status == str(TaskStatus.IN_PROGRESS))
+            total_tasks = int(row.total_tasks or 0)
+            completed_tasks = int(row.completed_tasks or 0)
+            pending_tasks = int(row.pending_tasks or 0)
+            in_progress_tasks = int(row.in_progress_tasks or 0)
             
             task_completion_rate = round((completed_tasks / total_tasks) * 100) if total_tasks > 0 else 0
             
             # Leave data
-            leaves = db.query(Leave).filter(
-                Leave.user_id == emp.user_id,
-                Leave.start_date >= start,
-                Leave.end_date <= end
-            ).all()
+            leaves = leaves_by_user[emp.user_id]
             
             total_leaves = len(leaves)
             approved_leaves = sum(1 for l in leaves if l.status == 'approved')
@@ -548,7 +796,7 @@ async def export_performance_report(
         if format.lower() == 'csv':
             return generate_csv_export(report_data, start_date, end_date, employee_id)
         elif format.lower() == 'pdf':
-            return generate_pdf_export(report_data, start_date, end_date, employee_id)
+            return await generate_pdf_export(report_data, start_date, end_date, employee_id)
         else:
             raise HTTPException(
                 status_code=http_status.HTTP_400_BAD_REQUEST,
@@ -569,10 +817,12 @@ async def export_performance_report(
         )
 
 
-def generate_csv_export(data: List[dict], start_date: str, end_date: str, employee_id: Optional[str]) -> StreamingResponse:
+def generate_csv_export(data: List[dict], start_date: str, end_date: str, employee_id: Optional[str]) -> Response:
     """Generate CSV export with comprehensive performance data"""
     
-    output = io.StringIO()
+    # Encode rows straight into one bytes buffer (no full str -> bytes copy at the end)
+    buffer = io.BytesIO()
+    output = io.TextIOWrapper(buffer, encoding='utf-8', newline='', write_through=True)
     writer = csv.writer(output)
     
     # Write header
@@ -591,8 +841,8 @@ def generate_csv_export(data: List[dict], start_date: str, end_date: str, employ
     ])
     
     # Write employee data
-    for emp in data:
-        writer.writerow([
+    writer.writerows([
+        [
             emp['employee_id'], emp['name'], emp['email'], emp['department'], emp['designation'], emp['role'],
             emp['working_days'], emp['attendance_days'], emp['attendance_score'], 
             emp['late_arrivals'], emp['early_departures'], emp['absent_days'],
@@ -601,35 +851,96 @@ def generate_csv_export(data: List[dict], start_date: str, end_date: str, employ
             emp['total_leaves'], emp['approved_leaves'], emp['pending_leaves'], emp['rejected_leaves'], 
             emp['total_leave_days'],
             emp['performance_score']
-        ])
+        ]
+        for emp in data
+    ])
     
     # Add leave type breakdown section
     writer.writerow([])
     writer.writerow(['Leave Type Breakdown'])
     writer.writerow(['Employee ID', 'Name', 'Leave Type', 'Count'])
     
-    for emp in data:
-        for leave_type, count in emp['leave_types'].items():
-            writer.writerow([emp['employee_id'], emp['name'], leave_type, count])
+    writer.writerows([
+        (emp['employee_id'], emp['name'], leave_type, count)
+        for emp in data
+        for leave_type, count in emp['leave_types'].items()
+    ])
     
-    # Prepare response
-    output.seek(0)
+    # Prepare response (detach so closing the wrapper doesn't close the buffer)
+    output.flush()
+    output.detach()
     filename = f"performance_report_{start_date}_to_{end_date}.csv"
     
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
+    return Response(
+        content=buffer.getbuffer(),
+        media_type="text/csv; charset=utf-8",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
 
 
-def generate_pdf_export(data: List[dict], start_date: str, end_date: str, employee_id: Optional[str]) -> StreamingResponse:
+async def generate_pdf_export(data: List[dict], start_date: str, end_date: str, employee_id: Optional[str]) -> Response:
     """Generate PDF export with comprehensive performance data"""
     
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=30, leftMargin=30, topMargin=30, bottomMargin=18)
+    # Workers write shards of the PDF to temp files; they are merged, streamed from disk and removed once sent
+    loop = asyncio.get_running_loop()
+    pool = get_pdf_pool()
+    shards = [data[i:i + PDF_SHARD_SIZE] for i in range(0, len(data), PDF_SHARD_SIZE)] or [[]]
+    results = await asyncio.gather(
+        *(
+            loop.run_in_executor(pool, _build_pdf, shard, start_date, end_date, len(data), index == 0)
+            for index, shard in enumerate(shards)
+        ),
+        return_exceptions=True
+    )
+    shard_paths = [result for result in results if isinstance(result, str)]
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        for path in shard_paths:
+            os.remove(path)
+        raise errors[0]
+    
+    if len(shard_paths) == 1:
+        pdf_path = shard_paths[0]
+    else:
+        pdf_path = await loop.run_in_executor(pool, _merge_pdfs, shard_paths)
     
-    # Container for the 'Flowable' objects
+    filename = f"performance_report_{start_date}_to_{end_date}.pdf"
+    
+    return FileResponse(
+        pdf_path,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        background=BackgroundTask(os.remove, pdf_path)
+    )
+
+
+def _merge_pdfs(paths: List[str]) -> str:
+    """Concatenate shard PDFs into a new temp file, removing the shards (runs in a worker process)"""
+    
+    writer = PdfWriter()
+    try:
+        for path in paths:
+            writer.append(path)
+        with tempfile.NamedTemporaryFile(prefix="performance_report_", suffix=".pdf", delete=False) as pdf_file:
+            writer.write(pdf_file)
+    finally:
+        for path in paths:
+            os.remove(path)
+    
+    return pdf_file.name
+
+
+def _build_pdf(data: List[dict], start_date: str, end_date: str, total_employees: int, include_header: bool = True) -> str:
+    """
+    Build the performance report PDF for some employees into a temp file and return its path
+    (runs in a worker process). Only the first shard of a report carries the title and info table.
+    """
+    
+    with tempfile.NamedTemporaryFile(prefix="performance_report_", suffix=".pdf", delete=False) as pdf_file:
+        pdf_path = pdf_file.name
+    pdf_canvas = canvas.Canvas(pdf_path, pagesize=A4)
+    
+    # Header flowables for the first page
     elements = []
     
     # Define styles
@@ -652,134 +963,192 @@ def generate_pdf_export(data: List[dict], start_date: str, end_date: str, employ
         spaceBefore=12
     )
     
-    # Title
-    title = Paragraph("Performance Report", title_style)
-    elements.append(title)
-    
-    # Report info
-    info_data = [
-        ['Report Period:', f'{start_date} to {end_date}'],
-        ['Generated:', datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
-        ['Total Employees:', str(len(data))]
-    ]
-    
-    info_table = Table(info_data, colWidths=[2*inch, 4*inch])
-    info_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e0e7ff')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey)
-    ]))
-    
-    elements.append(info_table)
-    elements.append(Spacer(1, 20))
-    
-    # Employee performance summary
-    for emp in data:
-        # Employee header
-        emp_heading = Paragraph(f"<b>{emp['name']}</b> ({emp['employee_id']})", heading_style)
-        elements.append(emp_heading)
+    if include_header:
+        # Title
+        title = Paragraph("Performance Report", title_style)
+        elements.append(title)
         
-        # Employee details
-        emp_details = [
-            ['Department:', emp['department'], 'Designation:', emp['designation']],
-            ['Email:', emp['email'], 'Role:', emp['role']],
+        # Report info
+        info_data = [
+            ['Report Period:', f'{start_date} to {end_date}'],
+            ['Generated:', datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
+            ['Total Employees:', str(total_employees)]
         ]
         
-        details_table = Table(emp_details, colWidths=[1.2*inch, 2*inch, 1.2*inch, 2*inch])
-        details_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f3f4f6')),
-            ('BACKGROUND', (2, 0), (2, -1), colors.HexColor('#f3f4f6')),
+        info_table = Table(info_data, colWidths=[2*inch, 4*inch])
+        info_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e0e7ff')),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
             ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey)
-        ]))
-        
-        elements.append(details_table)
-        elements.append(Spacer(1, 10))
-        
-        # Performance metrics
-        metrics_data = [
-            ['Metric', 'Value', 'Metric', 'Value'],
-            ['Attendance Score', f"{emp['attendance_score']}%", 'Task Completion', f"{emp['task_completion_rate']}%"],
-            ['Attendance Days', f"{emp['attendance_days']}/{emp['working_days']}", 'Completed Tasks', f"{emp['completed_tasks']}/{emp['total_tasks']}"],
-            ['Late Arrivals', str(emp['late_arrivals']), 'Pending Tasks', str(emp['pending_tasks'])],
-            ['Early Departures', str(emp['early_departures']), 'In Progress Tasks', str(emp['in_progress_tasks'])],
-            ['Absent Days', str(emp['absent_days']), 'Total Leaves', str(emp['total_leaves'])],
-            ['Approved Leaves', str(emp['approved_leaves']), 'Total Leave Days', str(emp['total_leave_days'])],
-        ]
-        
-        metrics_table = Table(metrics_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-        metrics_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')])
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+            ('GRID', (0, 0), (-1, -1), 1, colors.grey)
         ]))
         
-        elements.append(metrics_table)
+        elements.append(info_table)
+        elements.append(Spacer(1, 20))
+    
+    # Employee performance summary, one page per employee. Sections have a fixed layout,
+    # so they are placed straight onto the canvas instead of going through a doc template.
+    try:
+        y = _draw_flowables(pdf_canvas, elements, _PDF_TOP)
+        for emp in data:
+            _draw_flowables(pdf_canvas, _build_emp_section(emp, heading_style, styles['Normal']), y)
+            pdf_canvas.showPage()
+            y = _PDF_TOP
+        pdf_canvas.save()
+    except Exception:
+        os.remove(pdf_path)
+        raise
+    
+    return pdf_path
+
+
+# Printable area of a report page (page margins plus the 6pt frame padding platypus applies)
+_PDF_LEFT = 30 + 6
+_PDF_TOP = A4[1] - 30 - 6
+_PDF_BOTTOM = 18 + 6
+_PDF_WIDTH = A4[0] - 2 * (30 + 6)
+
+
+def _draw_flowables(pdf_canvas: canvas.Canvas, flowables: list, y: float) -> float:
+    """
+    Draw flowables top-down from y on the current page, moving to a new page when one
+    does not fit. Spacing follows platypus frames (space before is dropped at the top of a
+    page and overlaps the previous space after). Returns the y position below the last one.
+    """
+    prev_space_after = 0
+    for flowable in flowables:
+        space_before = max(flowable.getSpaceBefore() - prev_space_after, 0) if y < _PDF_TOP else 0
+        width, height = flowable.wrapOn(pdf_canvas, _PDF_WIDTH, y - _PDF_BOTTOM - space_before)
+        if y - space_before - height < _PDF_BOTTOM and y < _PDF_TOP:
+            pdf_canvas.showPage()
+            y, space_before = _PDF_TOP, 0
+            width, height = flowable.wrapOn(pdf_canvas, _PDF_WIDTH, y - _PDF_BOTTOM)
+        y -= space_before + height
+        flowable.drawOn(pdf_canvas, _PDF_LEFT, y, _sW=_PDF_WIDTH - width)
+        prev_space_after = flowable.getSpaceAfter()
+        y -= prev_space_after
+    return y
+
+
+# Table styles and column widths shared by every employee section (built once per worker process)
+_DETAILS_COL_WIDTHS = (1.2*inch, 2*inch, 1.2*inch, 2*inch)
+_DETAILS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f3f4f6')),
+    ('BACKGROUND', (2, 0), (2, -1), colors.HexColor('#f3f4f6')),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey)
+])
+
+_METRICS_COL_WIDTHS = (1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch)
+_METRICS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')])
+])
+
+_LEAVE_COL_WIDTHS = (3*inch, 1*inch)
+_LEAVE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8b5cf6')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')])
+])
+
+_SCORE_COL_WIDTHS = (4*inch, 2*inch)
+
+
+def _score_table_style(score_color) -> TableStyle:
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), score_color),
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ])
+
+
+_SCORE_GREEN = _score_table_style(colors.green)
+_SCORE_ORANGE = _score_table_style(colors.orange)
+_SCORE_RED = _score_table_style(colors.red)
+
+
+def _build_emp_section(emp: dict, heading_style: ParagraphStyle, normal_style: ParagraphStyle) -> list:
+    """Build the flowables for one employee's page of the performance report"""
+    
+    section = []
+    
+    # Employee header
+    emp_heading = Paragraph(f"<b>{emp['name']}</b> ({emp['employee_id']})", heading_style)
+    section.append(emp_heading)
+    
+    # Employee details
+    emp_details = [
+        ['Department:', emp['department'], 'Designation:', emp['designation']],
+        ['Email:', emp['email'], 'Role:', emp['role']],
+    ]
+    
+    details_table = Table(emp_details, colWidths=_DETAILS_COL_WIDTHS)
+    details_table.setStyle(_DETAILS_TABLE_STYLE)
+    
+    section.append(details_table)
+    section.append(Spacer(1, 10))
+    
+    # Performance metrics
+    metrics_data = [
+        ['Metric', 'Value', 'Metric', 'Value'],
+        ['Attendance Score', f"{emp['attendance_score']}%", 'Task Completion', f"{emp['task_completion_rate']}%"],
+        ['Attendance Days', f"{emp['attendance_days']}/{emp['working_days']}", 'Completed Tasks', f"{emp['completed_tasks']}/{emp['total_tasks']}"],
+        ['Late Arrivals', str(emp['late_arrivals']), 'Pending Tasks', str(emp['pending_tasks'])],
+        ['Early Departures', str(emp['early_departures']), 'In Progress Tasks', str(emp['in_progress_tasks'])],
+        ['Absent Days', str(emp['absent_days']), 'Total Leaves', str(emp['total_leaves'])],
+        ['Approved Leaves', str(emp['approved_leaves']), 'Total Leave Days', str(emp['total_leave_days'])],
+    ]
+    
+    metrics_table = Table(metrics_data, colWidths=_METRICS_COL_WIDTHS)
+    metrics_table.setStyle(_METRICS_TABLE_STYLE)
+    
+    section.append(metrics_table)
+    
+    # Leave type breakdown
+    if emp['leave_types']:
+        section.append(Spacer(1, 10))
+        leave_heading = Paragraph("<b>Leave Type Breakdown:</b>", normal_style)
+        section.append(leave_heading)
         
-        # Leave type breakdown
-        if emp['leave_types']:
-            elements.append(Spacer(1, 10))
-            leave_heading = Paragraph("<b>Leave Type Breakdown:</b>", styles['Normal'])
-            elements.append(leave_heading)
-            
-            leave_data = [['Leave Type', 'Count']]
-            for leave_type, count in emp['leave_types'].items():
-                leave_data.append([leave_type.title(), str(count)])
-            
-            leave_table = Table(leave_data, colWidths=[3*inch, 1*inch])
-            leave_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8b5cf6')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')])
-            ]))
-            
-            elements.append(leave_table)
+        leave_data = [['Leave Type', 'Count']]
+        for leave_type, count in emp['leave_types'].items():
+            leave_data.append([leave_type.title(), str(count)])
         
-        # Performance score highlight
-        elements.append(Spacer(1, 10))
-        score_color = colors.green if emp['performance_score'] >= 75 else colors.orange if emp['performance_score'] >= 60 else colors.red
-        score_data = [['Overall Performance Score', f"{emp['performance_score']}%"]]
-        score_table = Table(score_data, colWidths=[4*inch, 2*inch])
-        score_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), score_color),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ]))
+        leave_table = Table(leave_data, colWidths=_LEAVE_COL_WIDTHS)
+        leave_table.setStyle(_LEAVE_TABLE_STYLE)
         
-        elements.append(score_table)
-        elements.append(PageBreak())
+        section.append(leave_table)
     
-    # Build PDF
-    doc.build(elements)
+    # Performance score highlight
+    section.append(Spacer(1, 10))
+    score = emp['performance_score']
+    score_data = [['Overall Performance Score', f"{score}%"]]
+    score_table = Table(score_data, colWidths=_SCORE_COL_WIDTHS)
+    score_table.setStyle(_SCORE_GREEN if score >= 75 else _SCORE_ORANGE if score >= 60 else _SCORE_RED)
     
-    # Prepare response
-    buffer.seek(0)
-    filename = f"performance_report_{start_date}_to_{end_date}.pdf"
+    section.append(score_table)
     
-    return StreamingResponse(
-        buffer,
-        media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
-    )
+    return section
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from datetime import date, datetime, timedelta
 from typing import List, Optional
@@ -156,13 +156,13 @@ def get_my_shift_notifications(
                 logging.warning(f"Skipping notification {getattr(notification, 'notification_id', 'unknown')}: {str(e)}")
                 continue
         
-        return JSONResponse(content=result, status_code=200)
+        return ORJSONResponse(content=result, status_code=200)
     except Exception as e:
         import logging
         logging.error(f"Error fetching shift notifications: {str(e)}")
         import traceback
         logging.error(traceback.format_exc())
-        return JSONResponse(
+        return ORJSONResponse(
             content={"detail": f"Error fetching notifications: {str(e)}"},
             status_code=500
         )
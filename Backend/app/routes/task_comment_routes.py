@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, exists, select, lambda_stmt
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from datetime import datetime
 
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.db.models.task import Task
 from app.db.models.task_comment import TaskComment
 from app.db.models.user import User
@@ -13,6 +15,9 @@ from pydantic import BaseModel
 
 router = APIRouter(prefix="/tasks", tags=["Task Comments"])
 
+# Rows fetched per round trip when streaming a task's comment thread
+COMMENTS_STREAM_BATCH = 100
+
 
 # Schemas
 class TaskCommentCreate(BaseModel):
@@ -29,156 +34,211 @@ class TaskCommentOut(BaseModel):
     created_at: datetime
     updated_at: datetime | None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
+
+
+def _comment_out(comment: TaskComment, user: User | None) -> TaskCommentOut:
+    # User.role is an Enum(RoleEnum) column, so a loaded role is always the enum member
+    return TaskCommentOut(
+        id=comment.id,
+        task_id=comment.task_id,
+        user_id=comment.user_id,
+        user_name=user.name if user else "Unknown User",
+        user_role=user.role.value if user and user.role else "Unknown",
+        comment=comment.comment,
+        created_at=comment.created_at,
+        updated_at=comment.updated_at
+    )
 
 
 @router.get("/{task_id}/comments", response_model=List[TaskCommentOut])
-def get_task_comments(
+async def get_task_comments(
     task_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get all comments for a task.
     Only accessible by task assignee, assigned_to, or users involved in task passing.
     """
-    # Get the task
-    task = db.query(Task).filter(Task.task_id == task_id).first()
-    if not task:
+    # Get the task's access columns together with its comments and their authors in one query
+    # (a task without comments still yields one row, with comment and author set to None)
+    result = await db.stream(
+        select(
+            Task.assigned_by,
+            Task.assigned_to,
+            Task.last_passed_by,
+            Task.last_passed_to,
+            TaskComment,
+            User
+        )
+        .outerjoin(TaskComment, TaskComment.task_id == Task.task_id)
+        .outerjoin(User, User.user_id == TaskComment.user_id)
+        .where(Task.task_id == task_id)
+        .order_by(TaskComment.created_at.asc())
+        .execution_options(yield_per=COMMENTS_STREAM_BATCH)
+    )
+    batches = result.partitions(COMMENTS_STREAM_BATCH)
+    rows = await anext(batches, [])
+    if not rows:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
     
     # Check if user has access to this task
-    user_id = current_user.user_id
-    has_access = (
-        task.assigned_by == user_id or
-        task.assigned_to == user_id or
-        task.last_passed_by == user_id or
-        task.last_passed_to == user_id
-    )
-    
-    if not has_access:
+    task = rows[0]
+    if current_user.user_id not in {task.assigned_by, task.assigned_to, task.last_passed_by, task.last_passed_to}:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have access to view comments for this task"
         )
     
-    # Get all comments with user information
-    comments = (
-        db.query(TaskComment)
-        .filter(TaskComment.task_id == task_id)
-        .order_by(TaskComment.created_at.asc())
-        .all()
-    )
-    
-    # Format response with user information
-    result = []
-    for comment in comments:
-        user = db.query(User).filter(User.user_id == comment.user_id).first()
-        result.append(TaskCommentOut(
-            id=comment.id,
-            task_id=comment.task_id,
-            user_id=comment.user_id,
-            user_name=user.name if user else "Unknown User",
-            user_role=user.role.value if user and hasattr(user.role, 'value') else str(user.role) if user else "Unknown",
-            comment=comment.comment,
-            created_at=comment.created_at,
-            updated_at=comment.updated_at
-        ))
+    # Stream the JSON array batch by batch instead of materializing the whole thread
+    async def stream_comments():
+        yield b"["
+        separator = b""
+        batch = rows
+        while batch:
+            chunk = []
+            for *_, comment, user in batch:
+                if comment is None:
+                    continue
+                chunk.append(separator + _comment_out(comment, user).model_dump_json().encode())
+                separator = b","
+            if chunk:
+                yield b"".join(chunk)
+            batch = await anext(batches, [])
+        yield b"]"
     
-    return result
+    return StreamingResponse(stream_comments(), media_type="application/json")
 
 
-@router.post("/{task_id}/comments", response_model=TaskCommentOut, status_code=status.HTTP_201_CREATED)
-def create_task_comment(
-    task_id: int,
-    comment_data: TaskCommentCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-):
-    """
-    Add a comment to a task.
-    Only accessible by task assignee, assigned_to, or users involved in task passing.
-    """
-    # Get the task
-    task = db.query(Task).filter(Task.task_id == task_id).first()
+async def _require_comment_access(db: AsyncSession, task_id: int, user_id: int) -> None:
+    """Raise 404 if the task is missing and 403 if the user may not comment on it"""
+    # Get only the task's access columns
+    task = (
+        await db.execute(
+            lambda_stmt(
+                lambda: select(
+                    Task.assigned_by,
+                    Task.assigned_to,
+                    Task.last_passed_by,
+                    Task.last_passed_to
+                ).where(Task.task_id == task_id)
+            )
+        )
+    ).first()
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
     
-    # Check if user has access to comment on this task
-    user_id = current_user.user_id
-    has_access = (
-        task.assigned_by == user_id or
-        task.assigned_to == user_id or
-        task.last_passed_by == user_id or
-        task.last_passed_to == user_id
-    )
-    
-    if not has_access:
+    if user_id not in {task.assigned_by, task.assigned_to, task.last_passed_by, task.last_passed_to}:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have access to comment on this task"
         )
+
+
+@router.post("/{task_id}/comments", response_model=TaskCommentOut, status_code=status.HTTP_201_CREATED)
+async def create_task_comment(
+    task_id: int,
+    comment_data: TaskCommentCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Add a comment to a task.
+    Only accessible by task assignee, assigned_to, or users involved in task passing.
+    """
+    await _require_comment_access(db, task_id, current_user.user_id)
     
     # Create the comment
     new_comment = TaskComment(
         task_id=task_id,
-        user_id=user_id,
+        user_id=current_user.user_id,
         comment=comment_data.comment.strip()
     )
     
     db.add(new_comment)
-    db.commit()
-    db.refresh(new_comment)
+    # The INSERT returns the id, the timestamps are set client-side and the session
+    # doesn't expire on commit, so no refresh is needed
+    await db.commit()
     
     # Return with user information
-    return TaskCommentOut(
-        id=new_comment.id,
-        task_id=new_comment.task_id,
-        user_id=new_comment.user_id,
-        user_name=current_user.name,
-        user_role=current_user.role.value if hasattr(current_user.role, 'value') else str(current_user.role),
-        comment=new_comment.comment,
-        created_at=new_comment.created_at,
-        updated_at=new_comment.updated_at
-    )
+    return _comment_out(new_comment, current_user)
+
+
+@router.post("/{task_id}/comments:batch", response_model=List[TaskCommentOut], status_code=status.HTTP_201_CREATED)
+async def create_task_comments_batch(
+    task_id: int,
+    comments_data: List[TaskCommentCreate],
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Add several comments to a task in a single transaction (bulk import).
+    Same access rules as adding a single comment.
+    """
+    await _require_comment_access(db, task_id, current_user.user_id)
+    
+    new_comments = [
+        TaskComment(
+            task_id=task_id,
+            user_id=current_user.user_id,
+            comment=comment_data.comment.strip()
+        )
+        for comment_data in comments_data
+    ]
+    
+    db.add_all(new_comments)
+    await db.commit()
+    
+    return [_comment_out(comment, current_user) for comment in new_comments]
 
 
 @router.delete("/{task_id}/comments/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_task_comment(
+async def delete_task_comment(
     task_id: int,
     comment_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Delete a comment. Only the comment author can delete their own comment.
     """
-    comment = db.query(TaskComment).filter(
-        TaskComment.id == comment_id,
-        TaskComment.task_id == task_id
-    ).first()
-    
-    if not comment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Comment not found"
+    # Ownership is part of the WHERE clause, so the happy path is a single statement
+    result = await db.execute(
+        delete(TaskComment).where(
+            TaskComment.id == comment_id,
+            TaskComment.task_id == task_id,
+            TaskComment.user_id == current_user.user_id
         )
+    )
+    await db.commit()
     
-    # Only the comment author can delete it
-    if comment.user_id != current_user.user_id:
+    if result.rowcount == 0:
+        # Nothing deleted: tell a missing comment apart from someone else's
+        comment_exists = await db.scalar(
+            select(
+                exists().where(
+                    TaskComment.id == comment_id,
+                    TaskComment.task_id == task_id
+                )
+            )
+        )
+        if not comment_exists:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Comment not found"
+            )
+        
+        # Only the comment author can delete it
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You can only delete your own comments"
         )
     
-    db.delete(comment)
-    db.commit()
-    
     return None
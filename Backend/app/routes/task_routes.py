@@ -141,14 +141,20 @@ def pass_task_route(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    task = db.query(Task).filter(Task.task_id == task_id).first()
-    if not task:
+    # Task and new assignee are independent lookups, so fetch both in one round trip
+    row = (
+        db.query(Task, User)
+        .outerjoin(User, User.user_id == payload.new_assignee_id)
+        .filter(Task.task_id == task_id)
+        .first()
+    )
+    if not row:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    task, new_assignee = row
 
     if current_user.role != RoleEnum.ADMIN and task.assigned_to != current_user.user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only the current assignee can pass this task")
 
-    new_assignee = db.query(User).filter(User.user_id == payload.new_assignee_id).first()
     if not new_assignee:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="New assignee not found")
 
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from typing import List, Optional, Union
 from pathlib import Path
@@ -10,57 +11,191 @@ from app.crud.user_crud import (
     update_user_role,
     update_user_status,
     delete_user,
-    get_user_by_email,
-    get_user_by_employee_id,
-    get_user_by_phone,
-    get_user_by_pan_card,
-    get_user_by_aadhar_card,
+    get_user_duplicates,
+    duplicate_user_field,
+    phone_exists,
+    pan_card_exists,
+    aadhar_card_exists,
     get_user,
     export_users_pdf,
-    export_users_csv,
+    iter_users_csv,
 )
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.dependencies import require_roles, get_current_user
 from app.enums import RoleEnum
 from app.db.models.user import User
 import os
-import shutil
+import io
+import anyio
+import time
 from datetime import datetime
-from pydantic import EmailStr
-from starlette.responses import Response
+from pydantic import EmailStr, TypeAdapter
+from starlette.responses import Response, StreamingResponse
 from starlette.background import BackgroundTask
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
+EXPORT_CHUNK_SIZE = 64 * 1024
+# Created once at startup by app.main
+PROFILE_PHOTO_DIR = "static/profile_photos"
+COPY_BUFSIZE = 1024 * 1024
+MAX_PROFILE_PHOTO_BYTES = 5 * 1024 * 1024
+# Disk writes for photo uploads get their own few worker threads, so a burst of
+# registrations can't use up the shared threadpool that sync routes run on
+PHOTO_WRITE_LIMITER = anyio.CapacityLimiter(4)
+
+
+def _directory_listing(directory: str, listings: dict) -> set:
+    # One scandir per photo directory per request instead of one stat per user
+    if directory not in listings:
+        try:
+            with os.scandir(directory) as entries:
+                listings[directory] = {entry.name for entry in entries}
+        except OSError:
+            listings[directory] = set()
+    return listings[directory]
 
 
-def _profile_photo_exists(photo_path: Optional[str]) -> bool:
+def _profile_photo_exists(photo_path: Optional[str], listings: Optional[dict] = None) -> bool:
     if not photo_path:
         return False
+    if listings is not None:
+        candidate = os.path.normpath(os.path.join(BASE_DIR, photo_path))
+        return os.path.basename(candidate) in _directory_listing(os.path.dirname(candidate), listings)
     candidate = Path(photo_path)
     if not candidate.is_absolute():
         candidate = (BASE_DIR / photo_path).resolve()
     return candidate.exists()
 
 
-def _sanitize_user_record(user: User) -> dict:
-    data = UserOut.model_validate(user).model_dump()
-    if data.get("profile_photo") and not _profile_photo_exists(data["profile_photo"]):
-        data["profile_photo"] = None
-    return data
+def _sanitize_user_record(user: User, listings: Optional[dict] = None) -> Union[User, UserOut]:
+    # response_model=UserOut validates the row itself, so only build a copy when the photo must be dropped;
+    # a UserOut instance passes response validation as-is (no second walk over a dumped dict)
+    if not user.profile_photo or _profile_photo_exists(user.profile_photo, listings):
+        return user
+    return UserOut.model_validate(user).model_copy(update={"profile_photo": None})
 
 
-def _sanitize_users_response(payload: Union[User, List[User]]) -> Union[dict, List[dict]]:
+def _sanitize_users_response(payload: Union[User, List[User]]) -> Union[User, UserOut, List[Union[User, UserOut]]]:
     if isinstance(payload, list):
-        return [_sanitize_user_record(item) for item in payload]
-    return _sanitize_user_record(payload)
+        listings = {}
+        return [_sanitize_user_record(item, listings) for item in payload]
     return _sanitize_user_record(payload)
 
 
+# Read endpoints validate rows into UserOut once and let pydantic-core write the JSON bytes directly,
+# instead of FastAPI's validate -> python dicts -> orjson pipeline. Validation stays: UserOut
+# normalizes legacy values (blank strings, aadhar format, gender/shift aliases) on the way out.
+USER_OUT_ADAPTER = TypeAdapter(UserOut)
+USER_LIST_ADAPTER = TypeAdapter(List[UserOut])
+
+
+def _users_json_response(payload: Union[User, List[User]]) -> Response:
+    sanitized = _sanitize_users_response(payload)
+    adapter = USER_LIST_ADAPTER if isinstance(sanitized, list) else USER_OUT_ADAPTER
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(sanitized, from_attributes=True)),
+        media_type="application/json",
+    )
+
+
+def _source_fileno(source) -> Optional[int]:
+    # In-memory sources (BytesIO) have no descriptor; the caller falls back to a buffered copy
+    try:
+        return source.fileno()
+    except (AttributeError, io.UnsupportedOperation, OSError):
+        return None
+
+
+def _photo_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail="Profile photo must be 5 MB or smaller.",
+    )
+
+
+def _write_upload(source, file_path: str) -> None:
+    source.seek(0)
+    try:
+        with open(file_path, "wb") as buffer:
+            in_fd = _source_fileno(source) if hasattr(os, "sendfile") else None
+            if in_fd is not None:
+                try:
+                    # Both ends are regular files, so the kernel can copy without a userspace buffer
+                    out_fd = buffer.fileno()
+                    offset, size = 0, os.fstat(in_fd).st_size
+                    if size > MAX_PROFILE_PHOTO_BYTES:
+                        raise _photo_too_large()
+                    while offset < size:
+                        sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                    return
+                except OSError:
+                    buffer.seek(0)
+                    buffer.truncate()
+                    source.seek(0)
+            # Count what is actually copied: the declared size can be wrong or missing
+            copied = 0
+            while chunk := source.read(COPY_BUFSIZE):
+                copied += len(chunk)
+                if copied > MAX_PROFILE_PHOTO_BYTES:
+                    raise _photo_too_large()
+                buffer.write(chunk)
+    except BaseException:
+        # Never leave a partial or oversized file in static/
+        Path(file_path).unlink(missing_ok=True)
+        raise
+
+
+async def _save_profile_photo(profile_photo: UploadFile, employee_id: str) -> str:
+    # Reject photos declared oversized before anything is copied into static/;
+    # _write_upload enforces the same cap on the bytes it actually copies
+    if profile_photo.size is not None and profile_photo.size > MAX_PROFILE_PHOTO_BYTES:
+        raise _photo_too_large()
+
+    # Generate a unique filename (nanosecond suffix: two uploads in the same second don't collide)
+    file_extension = profile_photo.filename.rpartition('.')[-1]
+    file_name = f"{employee_id}_{time.time_ns()}.{file_extension}"
+    file_path = os.path.join(PROFILE_PHOTO_DIR, file_name)
+
+    # One worker-thread hop for the whole copy instead of one per chunk
+    await anyio.to_thread.run_sync(_write_upload, profile_photo.file, file_path, limiter=PHOTO_WRITE_LIMITER)
+    return file_path
+
+
+def _duplicate_user_conflict(error: IntegrityError, employee_id: str) -> HTTPException:
+    """409 naming the identifier whose unique index rejected a users INSERT/UPDATE"""
+    duplicate_details = {
+        "email": "Employee already exists with this email address",
+        "employee_id": f"Employee already exists with ID '{employee_id}'",
+        "phone": "Phone number already exists. Please enter a unique phone number.",
+        "pan_card": "PAN Card already exists. Please enter a unique PAN Card number.",
+        "aadhar_card": "Aadhar Card already exists. Please enter a unique Aadhar Card number.",
+    }
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=duplicate_details.get(
+            duplicate_user_field(error), "Employee already exists with the provided identifiers"
+        ),
+    )
+
+
+async def _iter_buffer(buffer):
+    # Send slices of the finished document without copying it into one bytes object
+    view = buffer.getbuffer()
+    try:
+        for start in range(0, len(view), EXPORT_CHUNK_SIZE):
+            yield view[start:start + EXPORT_CHUNK_SIZE]
+    finally:
+        view.release()
+
+
 router = APIRouter(prefix="/employees", tags=["Employees"])
 
 # ✅ Public: Register a new employee
 @router.post("/register", response_model=UserOut, status_code=status.HTTP_201_CREATED)
-def register_employee(
+async def register_employee(
     name: str = Form(...),
     email: EmailStr = Form(...),
     employee_id: str = Form(...),
@@ -76,7 +211,7 @@ def register_employee(
     shift_type: Optional[str] = Form(None),
     employee_type: Optional[str] = Form(None),  # ✅ Added
     profile_photo: Optional[UploadFile] = File(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
 
     email = email.strip()
@@ -84,62 +219,11 @@ def register_employee(
     pan_card = pan_card.strip().upper() if pan_card else None
     aadhar_card = aadhar_card.strip() if aadhar_card else None
 
-    # Check for duplicate email
-    existing_user = get_user_by_email(db, email)
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Employee already exists with this email address",
-        )
-    
-    # Check for duplicate employee_id
-    existing_employee = get_user_by_employee_id(db, employee_id)
-    if existing_employee:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Employee already exists with ID '{employee_id}'",
-        )
-
-    # Check for duplicate phone number
-    if phone and phone.strip():
-        existing_phone = get_user_by_phone(db, phone.strip())
-        if existing_phone:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Phone number already exists. Please enter a unique phone number.",
-            )
-
-    if pan_card:
-        duplicate_pan = get_user_by_pan_card(db, pan_card)
-        if duplicate_pan:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="PAN Card already exists. Please enter a unique PAN Card number.",
-            )
-
-    if aadhar_card:
-        duplicate_aadhar = get_user_by_aadhar_card(db, aadhar_card)
-        if duplicate_aadhar:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Aadhar Card already exists. Please enter a unique Aadhar Card number.",
-            )
-
+    # Duplicates are caught by the unique indexes on users when the INSERT runs,
+    # so there is no separate pre-check (and no window for a concurrent insert to slip in)
     profile_photo_path = None
     if profile_photo:
-        # Create a directory to store profile photos if it doesn't exist
-        UPLOAD_DIR = "static/profile_photos"
-        os.makedirs(UPLOAD_DIR, exist_ok=True)
-
-        # Generate a unique filename
-        file_extension = profile_photo.filename.split('.')[-1]
-        file_name = f"{employee_id}_{datetime.now().strftime('%Y%m%d%H%M%S')}.{file_extension}"
-        file_path = os.path.join(UPLOAD_DIR, file_name)
-
-        # Save the file
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(profile_photo.file, buffer)
-        profile_photo_path = file_path
+        profile_photo_path = await _save_profile_photo(profile_photo, employee_id)
 
     user_in = UserCreate(
         name=name,
@@ -160,13 +244,12 @@ def register_employee(
     )
 
     try:
-        created_user = create_user(db, user_in)
-    except IntegrityError:
-        db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Employee already exists with the provided identifiers",
-        )
+        created_user = await create_user(db, user_in)
+    except IntegrityError as e:
+        await db.rollback()
+        if profile_photo_path:
+            await anyio.Path(profile_photo_path).unlink(missing_ok=True)
+        raise _duplicate_user_conflict(e, employee_id)
     return _sanitize_users_response(created_user)
 
 # # ✅ Admin & HR: Get all employees with optional search and filter
@@ -196,38 +279,25 @@ def register_employee(
 
 #     return employees
 
-@router.get("/", response_model=List[UserOut])
-def get_all_employees_public(
-    db: Session = Depends(get_db),
+@router.get("/", response_model=None, responses={200: {"model": List[UserOut]}})
+async def get_all_employees_public(
+    db: AsyncSession = Depends(get_async_db),
     search: Optional[str] = Query(None, description="Search by name, email or department"),
     department: Optional[str] = Query(None, description="Filter by department"),
-    role: Optional[RoleEnum] = Query(None, description="Filter by role")
+    role: Optional[RoleEnum] = Query(None, description="Filter by role"),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Page size (omit to return every match)"),
+    after_id: Optional[int] = Query(None, ge=0, description="Return employees with user_id greater than this (pass the last user_id of the previous page)")
 ):
-    employees = list_users(db)  # ✅ fetch all users properly (no .query(list_users))
-
-    # Apply search filter
-    if search:
-        employees = [
-            emp for emp in employees
-            if search.lower() in emp.name.lower()
-            or search.lower() in emp.email.lower()
-            or (emp.department and search.lower() in emp.department.lower())
-        ]
-
-    # Apply department filter
-    if department:
-        employees = [emp for emp in employees if emp.department == department]
-
-    # Apply role filter
-    if role:
-        employees = [emp for emp in employees if emp.role == role]
-
-    return _sanitize_users_response(employees)
+    # Search, department and role filters are applied in the query
+    employees = await list_users(
+        db, search=search, department=department, role=role, after_id=after_id, limit=limit
+    )
+    return _users_json_response(employees)
 
 
 # ✅ Update employee details (Users can update their own profile, Admin/HR can update anyone)
 @router.put("/{user_id}", response_model=UserOut)
-def update_employee(
+async def update_employee(
     user_id: int,
     name: str = Form(...),
     email: str = Form(...),
@@ -238,13 +308,13 @@ def update_employee(
     address: Optional[str] = Form(None),
     role: str = Form("Employee"),
     gender: Optional[str] = Form(None),
-    resignation_date: Optional[str] = Form(None),
+    resignation_date: Optional[datetime] = Form(None),
     pan_card: Optional[str] = Form(None),
     aadhar_card: Optional[str] = Form(None),
     shift_type: Optional[str] = Form(None),
     employee_type: Optional[str] = Form(None),
     profile_photo: Optional[UploadFile] = File(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     # Check permissions: User can update their own profile OR must be Admin/HR to update others
@@ -254,82 +324,96 @@ def update_employee(
             detail="Operation not permitted. You can only update your own profile."
         )
     
-    employee = get_user(db, user_id)
+    employee = await get_user(db, user_id)
     if not employee:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found")
 
+    # Same normalization as register; blank values become NULL so the unique indexes
+    # on phone/PAN/Aadhar never see two employees with an empty string
+    phone = phone.strip() or None if phone else None
+    pan_card = pan_card.strip().upper() or None if pan_card else None
+    aadhar_card = aadhar_card.strip() or None if aadhar_card else None
+
+    # Check phone, PAN and Aadhar against other employees in one round trip
+    duplicates = await get_user_duplicates(
+        db,
+        phone=phone,
+        pan_card=pan_card,
+        aadhar_card=aadhar_card,
+        exclude_user_id=user_id,
+    )
+
     # Check for duplicate phone number (excluding current employee)
-    if phone and phone.strip():
-        existing_phone = get_user_by_phone(db, phone.strip())
-        if existing_phone and existing_phone.user_id != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Phone number already exists. Please enter a unique phone number.",
-            )
+    if "phone" in duplicates:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Phone number already exists. Please enter a unique phone number.",
+        )
 
     # Check for duplicate PAN card (excluding current employee)
-    if pan_card and pan_card.strip():
-        duplicate_pan = get_user_by_pan_card(db, pan_card.strip())
-        if duplicate_pan and duplicate_pan.user_id != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="PAN Card already exists. Please enter a unique PAN Card number.",
-            )
+    if "pan_card" in duplicates:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="PAN Card already exists. Please enter a unique PAN Card number.",
+        )
 
     # Check for duplicate Aadhar card (excluding current employee)
-    if aadhar_card and aadhar_card.strip():
-        duplicate_aadhar = get_user_by_aadhar_card(db, aadhar_card.strip())
-        if duplicate_aadhar and duplicate_aadhar.user_id != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Aadhar Card already exists. Please enter a unique Aadhar Card number.",
-            )
+    if "aadhar_card" in duplicates:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Aadhar Card already exists. Please enter a unique Aadhar Card number.",
+        )
 
     # Handle profile photo upload
-    profile_photo_path = employee.profile_photo  # Keep existing photo by default
+    previous_photo_path = employee.profile_photo
+    profile_photo_path = previous_photo_path  # Keep existing photo by default
     if profile_photo and profile_photo.filename:
         try:
-            # Create a directory to store profile photos if it doesn't exist
-            UPLOAD_DIR = "static/profile_photos"
-            os.makedirs(UPLOAD_DIR, exist_ok=True)
-            
-            # Generate a unique filename
-            file_extension = profile_photo.filename.split('.')[-1]
-            file_name = f"{employee_id}_{datetime.now().strftime('%Y%m%d%H%M%S')}.{file_extension}"
-            file_path = os.path.join(UPLOAD_DIR, file_name)
-            
-            # Save the file
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(profile_photo.file, buffer)
-            
-            profile_photo_path = file_path
+            profile_photo_path = await _save_profile_photo(profile_photo, employee_id)
+        except HTTPException:
+            raise
         except Exception as e:
             print(f"Error saving profile photo: {e}")
             # Continue without updating photo if there's an error
 
     # Update fields
-    employee.name = name
-    employee.email = email
-    employee.employee_id = employee_id
-    employee.department = department
-    employee.designation = designation
-    employee.phone = phone
-    employee.address = address
-    
+    payload = {
+        "name": name,
+        "email": email,
+        "employee_id": employee_id,
+        "department": department,
+        "designation": designation,
+        "phone": phone,
+        "address": address,
+        "gender": gender,
+        "resignation_date": resignation_date,
+        "pan_card": pan_card,
+        "aadhar_card": aadhar_card,
+        "shift_type": shift_type,
+        "employee_type": employee_type,
+        "profile_photo": profile_photo_path,
+    }
+
     # ✅ Only Admin/HR can change roles
     if current_user.role in [RoleEnum.ADMIN, RoleEnum.HR]:
-        employee.role = role
-    
-    employee.gender = gender
-    employee.resignation_date = resignation_date
-    employee.pan_card = pan_card
-    employee.aadhar_card = aadhar_card
-    employee.shift_type = shift_type
-    employee.employee_type = employee_type
-    employee.profile_photo = profile_photo_path
-
-    db.commit()
-    db.refresh(employee)
+        payload["role"] = role
+
+    # Forms often resubmit unchanged data: assign only the changed columns, and skip
+    # the write and the re-read entirely when nothing changed. The ORM flush (not a
+    # Core UPDATE) fires the User mapper events that clear the report department cache.
+    changes = {column: value for column, value in payload.items() if getattr(employee, column) != value}
+    if changes:
+        for column, value in changes.items():
+            setattr(employee, column, value)
+        try:
+            await db.commit()
+        except IntegrityError as e:
+            # A concurrent write can still take an identifier after the duplicate check
+            await db.rollback()
+            if profile_photo_path != previous_photo_path:
+                await anyio.Path(profile_photo_path).unlink(missing_ok=True)
+            raise _duplicate_user_conflict(e, employee_id)
+        await db.refresh(employee)
     return _sanitize_users_response(employee)
 
 # # ✅ Admin only: Update employee role
@@ -341,42 +425,43 @@ def update_employee(
 #         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found")
 #     return employee
 
-@router.put("/{user_id}/role", response_model=UserOut)
-def update_role_public(
+@router.put("/{user_id}/role", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+async def update_role_public(
     user_id: int,
     role_data: UpdateRoleSchema,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db),
+    _: RoleEnum = Depends(require_roles(RoleEnum.ADMIN, RoleEnum.HR)),
 ):
-    employee = update_user_role(db, user_id, role_data.role)
-    if not employee:
+    if not await update_user_role(db, user_id, role_data.role):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found")
-    return _sanitize_users_response(employee)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
-@router.put("/{user_id}/status", response_model=UserOut, summary="Activate/Deactivate Employee")
-def update_employee_status(
+@router.put("/{user_id}/status", status_code=status.HTTP_204_NO_CONTENT, response_class=Response, summary="Activate/Deactivate Employee")
+async def update_employee_status(
     user_id: int,
     status_data: UpdateStatusSchema,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db),
+    _: RoleEnum = Depends(require_roles(RoleEnum.ADMIN, RoleEnum.HR)),
 ):
     """
     Activate or deactivate an employee
     - **user_id**: The ID of the employee
     - **is_active**: True to activate, False to deactivate
     """
-    employee = update_user_status(db, user_id, status_data.is_active)
-    if not employee:
+    if not await update_user_status(db, user_id, status_data.is_active):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found")
-    return _sanitize_users_response(employee)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 @router.get("/export/pdf", summary="Download all user details as PDF")
-def download_users_pdf(
-    db: Session = Depends(get_db),
+async def download_users_pdf(
+    db: AsyncSession = Depends(get_async_db),
     # _: RoleEnum = Depends(require_roles([RoleEnum.ADMIN, RoleEnum.HR])) # Example for role-based access
 ):
     try:
-        pdf_buffer = export_users_pdf(db)
-        return Response(
-            content=pdf_buffer.getvalue(),
+        # ReportLab layout is CPU-bound, so build the document off the event loop
+        pdf_buffer = await run_in_threadpool(export_users_pdf, await list_users(db))
+        return StreamingResponse(
+            _iter_buffer(pdf_buffer),
             media_type="application/pdf",
             headers={
                 "Content-Disposition": "attachment; filename=\"employees_report.pdf\"",
@@ -390,13 +475,12 @@ def download_users_pdf(
         raise HTTPException(status_code=500, detail=f"Error generating PDF: {str(e)}")
 
 @router.get("/export/csv", summary="Download all user details as CSV")
-def download_users_csv(
-    db: Session = Depends(get_db),
+async def download_users_csv(
+    db: AsyncSession = Depends(get_async_db),
     # _: RoleEnum = Depends(require_roles([RoleEnum.ADMIN, RoleEnum.HR])) # Example for role-based access
 ):
-    csv_buffer = export_users_csv(db)
-    return Response(
-        content=csv_buffer.getvalue(),
+    return StreamingResponse(
+        iter_users_csv(db),
         media_type="text/csv",
         headers={
             "Content-Disposition": "attachment; filename=\"users_report.csv\""
@@ -406,9 +490,9 @@ def download_users_csv(
 
 # ✅ Delete employee (requires authentication)
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-def remove_employee(
+async def remove_employee(
     user_id: int, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)  # ✅ Only requires login, no role check
 ):
     # Optional: Allow users to delete only themselves, or Admin/HR to delete anyone
@@ -418,34 +502,33 @@ def remove_employee(
             detail="Operation not permitted. Only Admin/HR can delete other employees."
         )
     
-    employee = delete_user(db, user_id)
+    employee = await delete_user(db, user_id)
     if not employee:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found")
     return None
 
 # ✅ Admin & HR: Get single employee by ID
-@router.get("/{user_id}", response_model=UserOut)
-def get_single_employee(user_id: int, db: Session = Depends(get_db),
-                        _: RoleEnum = Depends(require_roles([RoleEnum.ADMIN, RoleEnum.HR]))):
-    employee = get_user(db, user_id)
+@router.get("/{user_id}", response_model=None, responses={200: {"model": UserOut}})
+async def get_single_employee(user_id: int, db: AsyncSession = Depends(get_async_db),
+                              _: RoleEnum = Depends(require_roles([RoleEnum.ADMIN, RoleEnum.HR]))):
+    employee = await get_user(db, user_id)
     if not employee:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found")
-    return _sanitize_users_response(employee)
+    return _users_json_response(employee)
 
 
 # ✅ Real-time validation endpoints for form fields
 @router.get("/validate/phone/{phone}")
-def validate_phone_availability(
+async def validate_phone_availability(
     phone: str, 
     exclude_user_id: int = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Check if phone number is available (not already taken)"""
     if not phone or not phone.strip():
         return {"available": True, "message": ""}
     
-    existing_user = get_user_by_phone(db, phone.strip())
-    if existing_user and (exclude_user_id is None or existing_user.user_id != exclude_user_id):
+    if await phone_exists(db, phone.strip(), exclude_user_id):
         return {
             "available": False, 
             "message": "Phone number already exists. Please enter a unique phone number."
@@ -455,17 +538,16 @@ def validate_phone_availability(
 
 
 @router.get("/validate/pan/{pan_card}")
-def validate_pan_availability(
+async def validate_pan_availability(
     pan_card: str, 
     exclude_user_id: int = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Check if PAN card is available (not already taken)"""
     if not pan_card or not pan_card.strip():
         return {"available": True, "message": ""}
     
-    existing_user = get_user_by_pan_card(db, pan_card.strip().upper())
-    if existing_user and (exclude_user_id is None or existing_user.user_id != exclude_user_id):
+    if await pan_card_exists(db, pan_card.strip().upper(), exclude_user_id):
         return {
             "available": False, 
             "message": "PAN Card already exists. Please enter a unique PAN Card number."
@@ -475,17 +557,16 @@ def validate_pan_availability(
 
 
 @router.get("/validate/aadhar/{aadhar_card}")
-def validate_aadhar_availability(
+async def validate_aadhar_availability(
     aadhar_card: str, 
     exclude_user_id: int = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Check if Aadhar card is available (not already taken)"""
     if not aadhar_card or not aadhar_card.strip():
         return {"available": True, "message": ""}
     
-    existing_user = get_user_by_aadhar_card(db, aadhar_card.strip())
-    if existing_user and (exclude_user_id is None or existing_user.user_id != exclude_user_id):
+    if await aadhar_card_exists(db, aadhar_card.strip(), exclude_user_id):
         return {
             "available": False, 
             "message": "Aadhar Card already exists. Please enter a unique Aadhar Card number."
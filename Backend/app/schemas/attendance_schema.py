@@ -6,37 +6,11 @@ import json
 class LocationData(BaseModel):
     latitude: float = Field(..., ge=-90, le=90, description="Latitude (-90 to 90)")
     longitude: float = Field(..., ge=-180, le=180, description="Longitude (-180 to 180)")
-    address: Optional[constr(max_length=500)] = Field(None, description="Human-readable address")
-    place_name: Optional[constr(max_length=255)] = Field(None, description="Place name")
+    address: Optional[str] = Field(None, max_length=500, description="Human-readable address")
+    place_name: Optional[str] = Field(None, max_length=255, description="Place name")
     accuracy: Optional[float] = Field(None, ge=0, le=10000, description="GPS accuracy in meters")
     timestamp: Optional[datetime] = Field(None, description="Location timestamp")
 
-    @field_validator('latitude')
-    @classmethod
-    def validate_latitude(cls, v: float) -> float:
-        """Validate latitude is within valid range"""
-        if not -90 <= v <= 90:
-            raise ValueError('Latitude must be between -90 and 90 degrees')
-        return v
-
-    @field_validator('longitude')
-    @classmethod
-    def validate_longitude(cls, v: float) -> float:
-        """Validate longitude is within valid range"""
-        if not -180 <= v <= 180:
-            raise ValueError('Longitude must be between -180 and 180 degrees')
-        return v
-
-    @field_validator('accuracy')
-    @classmethod
-    def validate_accuracy(cls, v: Optional[float]) -> Optional[float]:
-        """Validate GPS accuracy is reasonable"""
-        if v is not None and v < 0:
-            raise ValueError('GPS accuracy cannot be negative')
-        if v is not None and v > 10000:
-            raise ValueError('GPS accuracy seems unreasonably high (>10km)')
-        return v
-
     def to_dict(self):
         return {
             'latitude': self.latitude,
@@ -86,4 +60,18 @@ class AttendanceOut(AttendanceBase):
             raise ValueError('Total hours cannot exceed 24 hours in a day')
         return round(v, 2)
 
+    @classmethod
+    def from_orm_fast(cls, row: Dict[str, Any]) -> "AttendanceOut":
+        """Build from an attendance payload read back from the database, skipping validation.
+
+        Check-in/check-out invariants were enforced when the row was written, so read
+        endpoints use this instead of re-running the validators for every record.
+        """
+        values = {name: row[name] for name in cls.model_fields if name in row}
+        if values.get("total_hours") is None:
+            values.pop("total_hours", None)
+        else:
+            values["total_hours"] = round(float(values["total_hours"]), 2)
+        return cls.model_construct(**values)
+
     model_config = {"from_attributes": True}
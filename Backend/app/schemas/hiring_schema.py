@@ -1,39 +1,70 @@
-from pydantic import BaseModel, EmailStr, Field, field_validator, constr
-from typing import Optional, List, Literal
+from pydantic import BaseModel, BeforeValidator, EmailStr, Field, StringConstraints, field_validator
+from typing import Annotated, Optional, List, Literal
 from datetime import datetime, date, timedelta
+from functools import lru_cache
 import re
 
+# Compiled once; validators run on every candidate payload
+_NAME_RE = re.compile(r'^[a-zA-Z\s.]+$')
+_NON_DIGIT_RE = re.compile(r'[^0-9]')
+# 10-15 digits with any separators in between, decided in one pass
+_PHONE_RE = re.compile(r'^(?:[^0-9]*[0-9]){10,15}[^0-9]*$')
+_MAX_CLOSING_WINDOW = timedelta(days=365)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_email(value: str) -> str:
+    return value.strip().lower()
+
+
+def _normalize_email_input(value):
+    """Strip and lowercase string input before EmailStr validates it; anything else is left to EmailStr to reject"""
+    return _normalize_email(value) if isinstance(value, str) else value
+
+# Shared string types: each constraint set is declared once and reused across the models below
+Title255 = Annotated[str, StringConstraints(min_length=3, max_length=255, strip_whitespace=True)]
+Name255 = Annotated[str, StringConstraints(min_length=2, max_length=255, strip_whitespace=True)]
+Phone20 = Annotated[str, StringConstraints(min_length=10, max_length=20, strip_whitespace=True)]
+Text100 = Annotated[str, StringConstraints(max_length=100, strip_whitespace=True)]
+Text255 = Annotated[str, StringConstraints(max_length=255, strip_whitespace=True)]
+Text1000 = Annotated[str, StringConstraints(max_length=1000, strip_whitespace=True)]
+Text2000 = Annotated[str, StringConstraints(max_length=2000, strip_whitespace=True)]
+Text3000 = Annotated[str, StringConstraints(max_length=3000, strip_whitespace=True)]
+Text5000 = Annotated[str, StringConstraints(max_length=5000, strip_whitespace=True)]
+# Same strip().lower() normalization user_crud applies to user emails; repeated addresses hit the cache
+CandidateEmail = Annotated[EmailStr, BeforeValidator(_normalize_email_input)]
+
+# Shared choice types for the fields repeated across create/update/out models
+EmploymentType = Literal['full-time', 'part-time', 'contract', 'internship', 'temporary']
+VacancyStatus = Literal['open', 'closed', 'on-hold', 'filled']
+CandidateSource = Literal['linkedin', 'naukri', 'indeed', 'referral', 'website', 'other']
+CandidateStatus = Literal['applied', 'screening', 'interview', 'offered', 'rejected', 'hired', 'withdrawn']
+PostingPlatform = Literal['linkedin', 'naukri', 'indeed', 'other']
+
 # Vacancy Schemas
 class VacancyBase(BaseModel):
-    title: constr(min_length=3, max_length=255, strip_whitespace=True) = Field(..., description="Job title (3-255 characters)")
-    department: constr(min_length=2, max_length=255, strip_whitespace=True) = Field(..., description="Department name")
-    description: Optional[constr(max_length=5000, strip_whitespace=True)] = Field(None, description="Job description")
-    requirements: Optional[constr(max_length=3000, strip_whitespace=True)] = Field(None, description="Job requirements")
-    responsibilities: Optional[constr(max_length=3000, strip_whitespace=True)] = Field(None, description="Job responsibilities")
-    nice_to_have_skills: Optional[constr(max_length=1000, strip_whitespace=True)] = Field(None, description="Nice to have skills")
-    location: Optional[constr(max_length=255, strip_whitespace=True)] = Field(None, description="Job location")
-    employment_type: Optional[Literal['full-time', 'part-time', 'contract', 'internship', 'temporary']] = Field(None, description="Employment type")
-    experience_required: Optional[constr(max_length=100, strip_whitespace=True)] = Field(None, description="Experience required")
-    salary_range: Optional[constr(max_length=100, strip_whitespace=True)] = Field(None, description="Salary range")
-    status: Optional[Literal['open', 'closed', 'on-hold', 'filled']] = Field("open", description="Vacancy status")
+    title: Title255 = Field(..., description="Job title (3-255 characters)")
+    department: Name255 = Field(..., description="Department name")
+    description: Optional[Text5000] = Field(None, description="Job description")
+    requirements: Optional[Text3000] = Field(None, description="Job requirements")
+    responsibilities: Optional[Text3000] = Field(None, description="Job responsibilities")
+    nice_to_have_skills: Optional[Text1000] = Field(None, description="Nice to have skills")
+    location: Optional[Text255] = Field(None, description="Job location")
+    employment_type: Optional[EmploymentType] = Field(None, description="Employment type")
+    experience_required: Optional[Text100] = Field(None, description="Experience required")
+    salary_range: Optional[Text100] = Field(None, description="Salary range")
+    status: Optional[VacancyStatus] = Field("open", description="Vacancy status")
     closing_date: Optional[datetime] = Field(None, description="Application closing date")
 
-    @field_validator('title')
-    @classmethod
-    def validate_title(cls, v: str) -> str:
-        """Validate job title"""
-        if not v or not v.strip():
-            raise ValueError('Job title cannot be empty')
-        return v.strip()
-
     @field_validator('closing_date')
     @classmethod
     def validate_closing_date(cls, v: Optional[datetime]) -> Optional[datetime]:
         """Validate closing date is in the future"""
         if v is not None:
-            if v.date() < date.today():
+            today = date.today()
+            if v.date() < today:
                 raise ValueError('Closing date cannot be in the past')
-            if v.date() > date.today() + timedelta(days=365):
+            if v.date() > today + _MAX_CLOSING_WINDOW:
                 raise ValueError('Closing date cannot be more than 1 year in the future')
         return v
 
@@ -41,23 +72,26 @@ class VacancyCreate(VacancyBase):
     pass
 
 class VacancyUpdate(BaseModel):
-    title: Optional[constr(min_length=3, max_length=255, strip_whitespace=True)] = None
-    department: Optional[constr(min_length=2, max_length=255, strip_whitespace=True)] = None
-    description: Optional[constr(max_length=5000, strip_whitespace=True)] = None
-    requirements: Optional[constr(max_length=3000, strip_whitespace=True)] = None
-    responsibilities: Optional[constr(max_length=3000, strip_whitespace=True)] = None
-    nice_to_have_skills: Optional[constr(max_length=1000, strip_whitespace=True)] = None
-    location: Optional[constr(max_length=255, strip_whitespace=True)] = None
-    employment_type: Optional[Literal['full-time', 'part-time', 'contract', 'internship', 'temporary']] = None
-    experience_required: Optional[constr(max_length=100, strip_whitespace=True)] = None
-    salary_range: Optional[constr(max_length=100, strip_whitespace=True)] = None
-    status: Optional[Literal['open', 'closed', 'on-hold', 'filled']] = None
+    title: Optional[Title255] = None
+    department: Optional[Name255] = None
+    description: Optional[Text5000] = None
+    requirements: Optional[Text3000] = None
+    responsibilities: Optional[Text3000] = None
+    nice_to_have_skills: Optional[Text1000] = None
+    location: Optional[Text255] = None
+    employment_type: Optional[EmploymentType] = None
+    experience_required: Optional[Text100] = None
+    salary_range: Optional[Text100] = None
+    status: Optional[VacancyStatus] = None
     closing_date: Optional[datetime] = None
     posted_on_linkedin: Optional[bool] = None
     posted_on_naukri: Optional[bool] = None
     posted_on_indeed: Optional[bool] = None
     posted_on_other: Optional[bool] = None
-    social_media_links: Optional[constr(max_length=1000)] = None
+    social_media_links: Optional[str] = Field(None, max_length=1000)
+
+    # PATCH-style payload: reject unknown keys, leave absent fields as unvalidated None
+    model_config = {"extra": "forbid", "validate_default": False}
 
 class VacancyOut(VacancyBase):
     vacancy_id: int = Field(..., gt=0)
@@ -76,72 +110,60 @@ class VacancyOut(VacancyBase):
 # Candidate Schemas
 class CandidateBase(BaseModel):
     vacancy_id: int = Field(..., gt=0, description="Vacancy ID")
-    name: constr(min_length=2, max_length=255, strip_whitespace=True) = Field(..., description="Candidate name")
-    email: EmailStr = Field(..., description="Candidate email")
-    phone: Optional[constr(min_length=10, max_length=20, strip_whitespace=True)] = Field(None, description="Phone number")
-    cover_letter: Optional[constr(max_length=5000, strip_whitespace=True)] = Field(None, description="Cover letter")
+    name: Name255 = Field(..., description="Candidate name")
+    email: CandidateEmail = Field(..., description="Candidate email")
+    phone: Optional[Phone20] = Field(None, description="Phone number")
+    cover_letter: Optional[Text5000] = Field(None, description="Cover letter")
     experience_years: Optional[int] = Field(None, ge=0, le=70, description="Years of experience (0-70)")
-    current_company: Optional[constr(max_length=255, strip_whitespace=True)] = Field(None, description="Current company")
-    current_position: Optional[constr(max_length=255, strip_whitespace=True)] = Field(None, description="Current position")
-    expected_salary: Optional[constr(max_length=100, strip_whitespace=True)] = Field(None, description="Expected salary")
-    notice_period: Optional[constr(max_length=100, strip_whitespace=True)] = Field(None, description="Notice period")
-    source: Optional[Literal['linkedin', 'naukri', 'indeed', 'referral', 'website', 'other']] = Field(None, description="Application source")
+    current_company: Optional[Text255] = Field(None, description="Current company")
+    current_position: Optional[Text255] = Field(None, description="Current position")
+    expected_salary: Optional[Text100] = Field(None, description="Expected salary")
+    notice_period: Optional[Text100] = Field(None, description="Notice period")
+    source: Optional[CandidateSource] = Field(None, description="Application source")
 
     @field_validator('name')
     @classmethod
     def validate_name(cls, v: str) -> str:
-        """Validate candidate name"""
-        if not v or not v.strip():
-            raise ValueError('Candidate name cannot be empty')
-        if not re.match(r'^[a-zA-Z\s.]+$', v):
+        """Validate candidate name (already stripped and length-checked by Name255)"""
+        if not _NAME_RE.match(v):
             raise ValueError('Name must contain only letters, spaces, and dots')
-        return v.strip()
+        return v
 
     @field_validator('phone')
     @classmethod
     def validate_phone(cls, v: Optional[str]) -> Optional[str]:
         """Validate phone number"""
-        if v is not None:
-            digits = re.sub(r'[^0-9]', '', v)
-            if len(digits) < 10:
+        if v is not None and not _PHONE_RE.match(v):
+            # Invalid: count the digits only to pick the error message
+            if len(_NON_DIGIT_RE.sub('', v)) < 10:
                 raise ValueError('Phone number must have at least 10 digits')
-            if len(digits) > 15:
-                raise ValueError('Phone number cannot exceed 15 digits')
-        return v
-
-    @field_validator('experience_years')
-    @classmethod
-    def validate_experience(cls, v: Optional[int]) -> Optional[int]:
-        """Validate experience years"""
-        if v is not None:
-            if v < 0:
-                raise ValueError('Experience cannot be negative')
-            if v > 70:
-                raise ValueError('Experience years seems unreasonably high')
+            raise ValueError('Phone number cannot exceed 15 digits')
         return v
 
 class CandidateCreate(CandidateBase):
     resume_url: Optional[str] = Field(None, description="Resume file URL")
 
 class CandidateUpdate(BaseModel):
-    name: Optional[constr(min_length=2, max_length=255, strip_whitespace=True)] = None
-    email: Optional[EmailStr] = None
-    phone: Optional[constr(min_length=10, max_length=20, strip_whitespace=True)] = None
-    cover_letter: Optional[constr(max_length=5000, strip_whitespace=True)] = None
+    name: Optional[Name255] = None
+    email: Optional[CandidateEmail] = None
+    phone: Optional[Phone20] = None
+    cover_letter: Optional[Text5000] = None
     experience_years: Optional[int] = Field(None, ge=0, le=70)
-    current_company: Optional[constr(max_length=255, strip_whitespace=True)] = None
-    current_position: Optional[constr(max_length=255, strip_whitespace=True)] = None
-    expected_salary: Optional[constr(max_length=100, strip_whitespace=True)] = None
-    notice_period: Optional[constr(max_length=100, strip_whitespace=True)] = None
-    status: Optional[Literal['applied', 'screening', 'interview', 'offered', 'rejected', 'hired', 'withdrawn']] = None
+    current_company: Optional[Text255] = None
+    current_position: Optional[Text255] = None
+    expected_salary: Optional[Text100] = None
+    notice_period: Optional[Text100] = None
+    status: Optional[CandidateStatus] = None
     interview_date: Optional[datetime] = None
-    interview_notes: Optional[constr(max_length=2000, strip_whitespace=True)] = None
-    source: Optional[Literal['linkedin', 'naukri', 'indeed', 'referral', 'website', 'other']] = None
+    interview_notes: Optional[Text2000] = None
+    source: Optional[CandidateSource] = None
+
+    model_config = {"extra": "forbid", "validate_default": False}
 
 class CandidateOut(CandidateBase):
     candidate_id: int = Field(..., gt=0)
     resume_url: Optional[str] = None
-    status: Literal['applied', 'screening', 'interview', 'offered', 'rejected', 'hired', 'withdrawn']
+    status: CandidateStatus
     interview_date: Optional[datetime] = None
     interview_notes: Optional[str] = None
     applied_at: datetime
@@ -154,7 +176,7 @@ class CandidateOut(CandidateBase):
 # Social Media Posting Schema
 class SocialMediaPost(BaseModel):
     vacancy_id: int = Field(..., gt=0, description="Vacancy ID")
-    platforms: List[Literal['linkedin', 'naukri', 'indeed', 'other']] = Field(..., min_length=1, description="Platforms to post on")
+    platforms: List[PostingPlatform] = Field(..., min_length=1, description="Platforms to post on")
     links: Optional[dict] = Field(None, description="Platform-specific links")
 
     @field_validator('platforms')
@@ -163,6 +185,6 @@ class SocialMediaPost(BaseModel):
         """Validate platforms list"""
         if not v:
             raise ValueError('At least one platform must be selected')
-        # Remove duplicates
-        return list(set(v))
+        # Remove duplicates, keeping the order the platforms were given in
+        return list(dict.fromkeys(v))
 
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional
 from datetime import datetime
 
@@ -8,32 +8,18 @@ class LeaveAllocationConfigBase(BaseModel):
     casual_leave_allocation: int = Field(..., ge=0, le=365, description="Casual leave allocation (0-365)")
     other_leave_allocation: int = Field(..., ge=0, le=365, description="Other leave allocation (0-365)")
 
-    @field_validator('sick_leave_allocation', 'casual_leave_allocation', 'other_leave_allocation')
-    @classmethod
-    def validate_allocation(cls, v: int, info) -> int:
-        """Validate that individual allocations are not negative"""
-        if v < 0:
-            raise ValueError('Leave allocation cannot be negative')
-        return v
-
 class LeaveAllocationConfigCreate(LeaveAllocationConfigBase):
     """Schema for creating leave allocation configuration"""
     
-    @field_validator('sick_leave_allocation')
-    @classmethod
-    def validate_total_allocation(cls, v: int, info) -> int:
+    @model_validator(mode='after')
+    def validate_total_allocation(self):
         """Validate that total allocation doesn't exceed annual leave"""
-        if 'total_annual_leave' in info.data:
-            total = info.data['total_annual_leave']
-            sick = v
-            casual = info.data.get('casual_leave_allocation', 0)
-            other = info.data.get('other_leave_allocation', 0)
-            
-            # Note: We allow the sum to exceed total_annual_leave as they are separate buckets
-            # The validation is just to ensure reasonable values
-            if sick + casual + other > total * 2:  # Allow up to 2x for flexibility
-                raise ValueError(f'Total leave allocation ({sick + casual + other}) seems unreasonably high compared to annual leave ({total})')
-        return v
+        allocated = self.sick_leave_allocation + self.casual_leave_allocation + self.other_leave_allocation
+        # Note: We allow the sum to exceed total_annual_leave as they are separate buckets
+        # The validation is just to ensure reasonable values
+        if allocated > self.total_annual_leave * 2:  # Allow up to 2x for flexibility
+            raise ValueError(f'Total leave allocation ({allocated}) seems unreasonably high compared to annual leave ({self.total_annual_leave})')
+        return self
 
 class LeaveAllocationConfigUpdate(BaseModel):
     """Schema for updating leave allocation configuration"""
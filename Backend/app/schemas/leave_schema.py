@@ -1,69 +1,52 @@
-from pydantic import BaseModel, Field, field_validator, constr
+from pydantic import BaseModel, Field, computed_field, field_validator, model_validator, constr
 from datetime import date, datetime, timedelta
 from typing import Optional, Literal
 
+_EARLIEST_START_DATE = date(2000, 1, 1)
+_MAX_BACKDATE = timedelta(days=30)
+
+LeaveType = Literal['annual', 'sick', 'casual', 'maternity', 'paternity', 'work_from_home']
+LeaveStatus = Literal['Pending', 'Approved', 'Rejected']
+
 class LeaveBase(BaseModel):
     start_date: date = Field(..., description="Leave start date")
     end_date: date = Field(..., description="Leave end date")
     reason: Optional[constr(min_length=10, max_length=500, strip_whitespace=True)] = Field(None, description="Leave reason (10-500 characters)")
-    status: Optional[Literal['Pending', 'Approved', 'Rejected']] = Field("Pending", description="Leave status")
-    leave_type: Literal['annual', 'sick', 'casual', 'maternity', 'paternity', 'work_from_home'] = Field("annual", description="Type of leave")
-
-    @field_validator('end_date')
-    @classmethod
-    def validate_end_date(cls, v: date, info) -> date:
-        """Validate end date is not before start date"""
-        if 'start_date' in info.data:
-            start_date = info.data['start_date']
-            if v < start_date:
-                raise ValueError('End date cannot be before start date')
-            # Validate reasonable leave duration (max 365 days)
-            duration = (v - start_date).days + 1
-            if duration > 365:
-                raise ValueError('Leave duration cannot exceed 365 days')
-        return v
+    status: Optional[LeaveStatus] = Field("Pending", description="Leave status")
+    leave_type: LeaveType = Field("annual", description="Type of leave")
 
     @field_validator('start_date')
     @classmethod
     def validate_start_date(cls, v: date) -> date:
         """Validate start date is not too far in the past"""
-        if v < date(2000, 1, 1):
+        if v < _EARLIEST_START_DATE:
             raise ValueError('Start date cannot be before year 2000')
         # Allow backdated leaves up to 30 days
-        if v < date.today() - timedelta(days=30):
+        if v < date.today() - _MAX_BACKDATE:
             raise ValueError('Cannot apply for leave more than 30 days in the past')
         return v
 
-    @field_validator('reason')
-    @classmethod
-    def validate_reason(cls, v: Optional[str]) -> Optional[str]:
-        """Validate reason is meaningful"""
-        if v is not None:
-            v = v.strip()
-            if len(v) < 10:
-                raise ValueError('Leave reason must be at least 10 characters')
-            if len(v) > 500:
-                raise ValueError('Leave reason cannot exceed 500 characters')
-        return v
+    @model_validator(mode='after')
+    def validate_date_range(self):
+        """Validate end date is not before start date and the leave spans at most 365 days"""
+        if self.end_date < self.start_date:
+            raise ValueError('End date cannot be before start date')
+        # Inclusive day count from ordinals (plain int arithmetic, no timedelta)
+        if self.end_date.toordinal() - self.start_date.toordinal() + 1 > 365:
+            raise ValueError('Leave duration cannot exceed 365 days')
+        return self
 
 
 class LeaveCreate(LeaveBase):
     employee_id: constr(min_length=1, max_length=50, strip_whitespace=True) = Field(..., description="Employee ID")
 
-    @field_validator('employee_id')
-    @classmethod
-    def validate_employee_id(cls, v: str) -> str:
-        """Validate employee ID is not empty"""
-        if not v or not v.strip():
-            raise ValueError('Employee ID cannot be empty')
-        return v.strip()
-
 
 class LeaveOut(LeaveBase):
     leave_id: int = Field(..., gt=0, description="Unique leave ID")
     user_id: int = Field(..., gt=0, description="User ID")
 
-    model_config = {"from_attributes": True}
+    # Response-only: built from a row and serialized, never modified
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class LeaveWithUserOut(LeaveOut):
@@ -77,7 +60,10 @@ class LeaveUpdate(BaseModel):
     start_date: Optional[date] = Field(None, description="New start date")
     end_date: Optional[date] = Field(None, description="New end date")
     reason: Optional[constr(min_length=10, max_length=500, strip_whitespace=True)] = Field(None, description="Updated reason")
-    leave_type: Optional[Literal['annual', 'sick', 'casual', 'maternity', 'paternity', 'work_from_home']] = Field(None, description="Updated leave type")
+    leave_type: Optional[LeaveType] = Field(None, description="Updated leave type")
+
+    # Unknown keys are rejected rather than silently dropped
+    model_config = {"extra": "forbid", "validate_default": False}
 
     @field_validator('end_date')
     @classmethod
@@ -93,17 +79,12 @@ class LeaveBalanceItem(BaseModel):
     leave_type: str = Field(..., description="Type of leave")
     allocated: int = Field(..., ge=0, description="Total allocated days")
     used: int = Field(..., ge=0, description="Days used")
-    remaining: int = Field(..., ge=0, description="Days remaining")
 
-    @field_validator('remaining')
-    @classmethod
-    def validate_remaining(cls, v: int, info) -> int:
-        """Validate remaining is consistent with allocated and used"""
-        if 'allocated' in info.data and 'used' in info.data:
-            expected_remaining = info.data['allocated'] - info.data['used']
-            if v != expected_remaining:
-                raise ValueError(f'Remaining days ({v}) does not match allocated ({info.data["allocated"]}) - used ({info.data["used"]})')
-        return v
+    @computed_field(description="Days remaining")
+    @property
+    def remaining(self) -> int:
+        # Derived rather than validated; floored at 0 when more days were used than allocated
+        return max(self.allocated - self.used, 0)
 
 
 class LeaveBalanceResponse(BaseModel):
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 
 
 class OfficeTimingBase(BaseModel):
@@ -11,7 +11,8 @@ class OfficeTimingBase(BaseModel):
     check_in_grace_minutes: int = Field(default=0, ge=0, le=180)
     check_out_grace_minutes: int = Field(default=0, ge=0, le=180)
 
-    @validator("start_time", "end_time")
+    @field_validator("start_time", "end_time")
+    @classmethod
     def validate_time_format(cls, value: str) -> str:
         try:
             datetime.strptime(value, "%H:%M")
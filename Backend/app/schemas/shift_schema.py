@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 from datetime import time, date, datetime
 from typing import Optional, List
 
@@ -11,14 +11,17 @@ class ShiftBase(BaseModel):
     description: Optional[str] = Field(None, max_length=500)
     is_active: bool = Field(True, description="Whether the shift is active")
 
-    @validator('start_time', 'end_time', pre=True)
+    @field_validator('start_time', 'end_time', mode='before')
+    @classmethod
     def parse_time_string(cls, v):
         if isinstance(v, time):
             return v.strftime("%H:%M")
         return v
 
-    @validator('end_time')
-    def end_time_must_be_after_start_time(cls, v, values):
+    @field_validator('end_time')
+    @classmethod
+    def end_time_must_be_after_start_time(cls, v, info):
+        values = info.data
         if 'start_time' in values and v:
             start = datetime.strptime(values['start_time'], "%H:%M").time()
             end = datetime.strptime(v, "%H:%M").time()
@@ -43,8 +46,10 @@ class ShiftUpdate(BaseModel):
     description: Optional[str] = Field(None, max_length=500)
     is_active: Optional[bool] = None
 
-    @validator('end_time')
-    def end_time_must_be_after_start_time_update(cls, v, values):
+    @field_validator('end_time')
+    @classmethod
+    def end_time_must_be_after_start_time_update(cls, v, info):
+        values = info.data
         if 'start_time' in values and v and values['start_time']:
             start = datetime.strptime(values['start_time'], "%H:%M").time()
             end = datetime.strptime(v, "%H:%M").time()
@@ -2,6 +2,9 @@ from pydantic import BaseModel, Field, field_validator, constr
 from datetime import datetime, date, timedelta
 from typing import Optional, Literal
 
+_EARLIEST_DUE_DATE = date(2000, 1, 1)
+_MAX_DUE_WINDOW = timedelta(days=3650)  # 10 years
+
 class TaskBase(BaseModel):
     title: constr(min_length=3, max_length=255, strip_whitespace=True) = Field(..., description="Task title (3-255 characters)")
     description: Optional[constr(max_length=2000, strip_whitespace=True)] = Field(None, description="Task description (max 2000 characters)")
@@ -9,26 +12,16 @@ class TaskBase(BaseModel):
     due_date: Optional[date] = Field(None, description="Task due date")
     priority: Optional[Literal['Low', 'Medium', 'High', 'Urgent']] = Field("Medium", description="Task priority")
 
-    @field_validator('title')
-    @classmethod
-    def validate_title(cls, v: str) -> str:
-        """Validate title is meaningful"""
-        if not v or not v.strip():
-            raise ValueError('Task title cannot be empty')
-        if len(v.strip()) < 3:
-            raise ValueError('Task title must be at least 3 characters')
-        return v.strip()
-
     @field_validator('due_date')
     @classmethod
     def validate_due_date(cls, v: Optional[date]) -> Optional[date]:
         """Validate due date is reasonable"""
         if v is not None:
-            if v < date(2000, 1, 1):
+            if v < _EARLIEST_DUE_DATE:
                 raise ValueError('Due date cannot be before year 2000')
             # Allow tasks to be created with past due dates (for historical data)
             # but warn if too far in the future
-            if v > date.today() + timedelta(days=3650):  # 10 years
+            if v > date.today() + _MAX_DUE_WINDOW:
                 raise ValueError('Due date cannot be more than 10 years in the future')
         return v
 
@@ -51,7 +44,7 @@ class TaskOut(TaskBase):
     created_at: Optional[datetime] = Field(None, description="Creation timestamp")
     last_passed_by: Optional[int] = Field(None, gt=0, description="Last user who passed the task")
     last_passed_to: Optional[int] = Field(None, gt=0, description="Last user task was passed to")
-    last_pass_note: Optional[constr(max_length=500)] = Field(None, description="Note from last pass")
+    last_pass_note: Optional[str] = Field(None, max_length=500, description="Note from last pass")
     last_passed_at: Optional[datetime] = Field(None, description="Timestamp of last pass")
 
     model_config = {"from_attributes": True}
@@ -63,32 +56,11 @@ class TaskUpdate(BaseModel):
     assigned_to: Optional[int] = Field(None, gt=0, description="New assignee user ID")
     due_date: Optional[date] = Field(None, description="Updated due date")
 
-    @field_validator('title')
-    @classmethod
-    def validate_title(cls, v: Optional[str]) -> Optional[str]:
-        """Validate title if provided"""
-        if v is not None:
-            if not v.strip():
-                raise ValueError('Task title cannot be empty')
-            if len(v.strip()) < 3:
-                raise ValueError('Task title must be at least 3 characters')
-        return v.strip() if v else v
-
 
 class TaskPassRequest(BaseModel):
     new_assignee_id: int = Field(..., gt=0, description="User ID to pass task to")
     note: Optional[constr(min_length=5, max_length=500, strip_whitespace=True)] = Field(None, description="Note explaining the pass (5-500 characters)")
 
-    @field_validator('note')
-    @classmethod
-    def validate_note(cls, v: Optional[str]) -> Optional[str]:
-        """Validate note if provided"""
-        if v is not None:
-            v = v.strip()
-            if len(v) < 5:
-                raise ValueError('Pass note must be at least 5 characters if provided')
-        return v
-
 
 class TaskHistoryOut(BaseModel):
     id: int = Field(..., gt=0, description="History entry ID")
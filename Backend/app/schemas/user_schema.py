@@ -4,6 +4,12 @@ from datetime import datetime
 from app.enums import RoleEnum
 import re
 
+# Compiled once; validators run on every user payload
+_NAME_RE = re.compile(r'^[a-zA-Z\s]+$')
+_NON_DIGIT_RE = re.compile(r'[^0-9]')
+_NON_DECIMAL_RE = re.compile(r'\D')
+_PAN_CARD_RE = re.compile(r'^[A-Z]{5}[0-9]{4}[A-Z]{1}$')
+
 def _normalize_literal(value: Optional[str], *, mapping: dict[str, str], field_name: str) -> Optional[str]:
     """Normalize literal inputs (case/alias insensitive)."""
     if value is None:
@@ -46,12 +52,10 @@ class UserBase(BaseModel):
     @field_validator('name')
     @classmethod
     def validate_name(cls, v: str) -> str:
-        """Validate name contains only letters and spaces"""
-        if not v or not v.strip():
-            raise ValueError('Name cannot be empty')
-        if not re.match(r'^[a-zA-Z\s]+$', v):
+        """Validate name contains only letters and spaces (constr already stripped it)"""
+        if not _NAME_RE.match(v):
             raise ValueError('Name must contain only letters and spaces')
-        return v.strip()
+        return v
 
     @field_validator('phone')
     @classmethod
@@ -60,12 +64,12 @@ class UserBase(BaseModel):
         if v is None:
             return v
         # Remove all non-digit characters for validation
-        digits = re.sub(r'[^0-9]', '', v)
+        digits = _NON_DIGIT_RE.sub('', v)
         if len(digits) < 10:
             raise ValueError('Phone number must have at least 10 digits')
         if len(digits) > 15:
             raise ValueError('Phone number cannot exceed 15 digits')
-        return v.strip()
+        return v
 
     @field_validator('gender', mode='before')
     @classmethod
@@ -121,7 +125,7 @@ class UserBase(BaseModel):
         if v is None:
             return v
         v = v.strip().upper()
-        if not re.match(r'^[A-Z]{5}[0-9]{4}[A-Z]{1}$', v):
+        if not _PAN_CARD_RE.match(v):
             raise ValueError('Invalid PAN card format. Expected format: ABCDE1234F')
         return v
 
@@ -131,7 +135,7 @@ class UserBase(BaseModel):
         """Validate Aadhar card format (1234-5678-9012) while allowing raw digits."""
         if v is None:
             return v
-        digits = re.sub(r'\D', '', v)
+        digits = _NON_DECIMAL_RE.sub('', v)
         if len(digits) != 12:
             raise ValueError('Invalid Aadhar card format. Expected 12 digits (e.g., 1234-5678-9012)')
         return f"{digits[0:4]}-{digits[4:8]}-{digits[8:12]}"
@@ -165,11 +169,7 @@ class UserCreate(UserBase):
     @field_validator('employee_id')
     @classmethod
     def validate_employee_id(cls, v: str) -> str:
-        """Validate employee ID format"""
-        if not v or not v.strip():
-            raise ValueError('Employee ID cannot be empty')
-        v = v.strip()
-        # Remove spaces from employee ID
+        """Validate employee ID format (constr already stripped it)"""
         if ' ' in v:
             raise ValueError('Employee ID cannot contain spaces')
         return v
@@ -1,4 +1,5 @@
 import smtplib
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from app.core.config import settings
@@ -6,7 +7,41 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-def send_otp_email(email: str, otp: int, environment_info: dict = None):
+class SMTPConnection:
+    """Process-wide SMTP session reused across sends (connect + STARTTLS + login happen once)"""
+
+    def __init__(self):
+        self._server = None
+        # smtplib sessions are not thread-safe and sends run in the threadpool
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=30)
+        server.starttls()
+        server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
+        return server
+
+    def send_message(self, msg):
+        with self._lock:
+            if self._server is None:
+                self._server = self._connect()
+            try:
+                self._server.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Server closed the idle session; reconnect once and retry
+                self._server = self._connect()
+                self._server.send_message(msg)
+
+    def close(self):
+        with self._lock:
+            if self._server is not None:
+                try:
+                    self._server.quit()
+                except smtplib.SMTPException:
+                    pass
+                self._server = None
+
+def send_otp_email(email: str, otp: int, environment_info: dict = None, smtp_client: SMTPConnection = None):
     """Send OTP email based on environment settings"""
     
     if not settings.should_send_email:
@@ -79,11 +114,14 @@ def send_otp_email(email: str, otp: int, environment_info: dict = None):
         
         msg.attach(MIMEText(body, 'html'))
         
-        # Send email
-        with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-            server.starttls()
-            server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
-            server.send_message(msg)
+        # Send email over the shared session when one is provided
+        if smtp_client is not None:
+            smtp_client.send_message(msg)
+        else:
+            with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT) as server:
+                server.starttls()
+                server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
+                server.send_message(msg)
         
         logger.info(f"OTP email sent successfully to {email} in {settings.ENVIRONMENT} environment")
         return True
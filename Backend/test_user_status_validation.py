@@ -12,6 +12,9 @@ from datetime import datetime
 # Configuration
 BASE_URL = "https://staffly.space"
 TEST_EMAIL = "test@example.com"  # Replace with a test user email
+ADMIN_TOKEN = ""  # Replace with an Admin/HR access token
+TEST_USER_ID = 0  # Replace with the user_id of an active test user
+TEST_USER_TOKEN = ""  # Replace with an access token issued to that user
 
 def test_user_status_validation():
     """Test that inactive users cannot log in"""
@@ -83,6 +86,58 @@ def test_active_user_flow():
     print("3. Try verifying OTP - should succeed")
     print("4. Try accessing protected endpoints - should succeed")
 
+def test_deactivated_token_rejected():
+    """Test that a logged-in user's token stops working as soon as they are deactivated"""
+    
+    print("\n🧪 Testing Deactivated Token Rejection")
+    print("=" * 50)
+    
+    if not (ADMIN_TOKEN and TEST_USER_ID and TEST_USER_TOKEN):
+        print("⚠️  Set ADMIN_TOKEN, TEST_USER_ID and TEST_USER_TOKEN to run this test")
+        return True
+    
+    admin_headers = {"Authorization": f"Bearer {ADMIN_TOKEN}"}
+    user_headers = {"Authorization": f"Bearer {TEST_USER_TOKEN}"}
+    
+    try:
+        # 1. The token works while the user is active (this also caches its claims)
+        response = requests.get(f"{BASE_URL}/dashboard/employee", headers=user_headers)
+        if response.status_code != 200:
+            print(f"❌ FAIL: Active user's token was rejected ({response.status_code})")
+            return False
+        print("✅ PASS: Active user's token is accepted")
+        
+        # 2. Deactivate the user
+        response = requests.put(
+            f"{BASE_URL}/employees/{TEST_USER_ID}/status",
+            headers=admin_headers,
+            json={"is_active": False},
+        )
+        if response.status_code != 204:
+            print(f"❌ FAIL: Could not deactivate user ({response.status_code})")
+            return False
+        
+        # 3. The very next request with the same token must be refused
+        response = requests.get(f"{BASE_URL}/dashboard/employee", headers=user_headers)
+        if response.status_code == 403:
+            print("✅ PASS: Deactivated user's token is rejected on the next request")
+            success = True
+        else:
+            print(f"❌ FAIL: Deactivated user's token still accepted ({response.status_code})")
+            success = False
+        
+        # 4. Restore the user
+        requests.put(
+            f"{BASE_URL}/employees/{TEST_USER_ID}/status",
+            headers=admin_headers,
+            json={"is_active": True},
+        )
+        return success
+            
+    except requests.exceptions.RequestException as e:
+        print(f"❌ ERROR: Could not connect to server: {e}")
+        return False
+
 def check_database_status():
     """Check if we can connect to the API"""
     
@@ -114,6 +169,7 @@ def main():
     
     # Run tests
     success = test_user_status_validation()
+    success = test_deactivated_token_rejected() and success
     test_active_user_flow()
     
     print("\n" + "=" * 60)
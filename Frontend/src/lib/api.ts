@@ -387,7 +387,7 @@ class ApiService {
   }
 
   // Update employee status (activate/deactivate)
-  async updateEmployeeStatus(userId: string, isActive: boolean): Promise<Employee> {
+  async updateEmployeeStatus(userId: string, isActive: boolean): Promise<void> {
     const token = localStorage.getItem('token');
     
     const response = await fetch(`${this.baseURL}/employees/${userId}/status`, {
@@ -403,8 +403,6 @@ class ApiService {
       const errorData = await response.json().catch(() => ({}));
       throw new Error(errorData.detail || `HTTP error! status: ${response.status}`);
     }
-
-    return await response.json();
   }
 
   // Submit a leave request
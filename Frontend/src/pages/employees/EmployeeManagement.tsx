@@ -859,7 +859,7 @@ const formatAadharInput = (value: string) => {
 
     try {
       // Call API to update status
-      const updatedEmployee = await apiService.updateEmployeeStatus(employee.id.toString(), isActive);
+      await apiService.updateEmployeeStatus(employee.id.toString(), isActive);
       
       // Update local state
       setEmployees((prev) =>